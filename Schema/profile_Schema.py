@@ -0,0 +1,35 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+
+# Define the user profile schema (the documents stored in UserProfile)
+class WorkExperience(BaseModel):
+    """Schema for one job in the user's work history."""
+    company: str = Field(description="Name of the company")
+    role: str = Field(description="Job title held at the company")
+    duration: str = Field(default="", description="Employment period, e.g. 'Jan 2019 - Present'")
+    location: str = Field(default="", description="City/region or 'Remote'")
+    achievements: List[str] = Field(default_factory=list, description="Responsibilities and achievements")
+
+class Education(BaseModel):
+    """Schema for one education entry."""
+    institution: str = Field(description="Name of the school or university")
+    degree: str = Field(default="", description="Degree obtained, e.g. Bachelor's, Master's")
+    field: str = Field(default="", description="Field of study")
+    graduation_date: str = Field(default="", description="Graduation year or date")
+    gpa: str = Field(default="", description="GPA if mentioned")
+
+class ParsedFragment(BaseModel):
+    """Structured reading of one resume fragment the local parser could not resolve."""
+    id: int = Field(description="The id of the fragment this entry belongs to")
+    work_experience: Optional[WorkExperience] = Field(
+        default=None, description="Set if the fragment describes a job"
+    )
+    education: Optional[Education] = Field(
+        default=None, description="Set if the fragment describes an education entry"
+    )
+
+class ParsedFragments(BaseModel):
+    """Schema for a batch of parsed resume fragments."""
+    fragments: List[ParsedFragment] = Field(description="One entry per input fragment")
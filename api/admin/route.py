@@ -0,0 +1,82 @@
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Annotated
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File, status
+
+from sqlalchemy.orm import Session
+
+from database import get_db
+from database.database import SessionLocal
+from database.repositories.import_job import create_import_job, get_import_job, update_import_job
+from api.dependencies import require_admin
+from api.uploads import save_upload
+from userImporter import import_users, iter_records
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="",
+    tags=["admin"],
+    dependencies=[Depends(require_admin)]
+)
+
+db_dependency = Annotated[Session, Depends(get_db)]
+
+MAX_IMPORT_SIZE = 512 * 1024 * 1024
+
+def _run_import(job_id: int, path: str):
+    # Runs after the response is sent, with its own session, and records
+    # its progress on the job after every chunk.
+    db = SessionLocal()
+    try:
+        update_import_job(db, job_id, status="running")
+        stats = import_users(
+            iter_records(path),
+            progress=lambda stats: update_import_job(db, job_id, stats=stats),
+        )
+        update_import_job(db, job_id, status="succeeded", stats=stats, finished_at=datetime.now(timezone.utc))
+    except Exception as e:
+        logger.exception("User import job %s failed", job_id)
+        db.rollback()
+        update_import_job(db, job_id, status="failed", error=str(e), finished_at=datetime.now(timezone.utc))
+    finally:
+        os.unlink(path)
+        db.close()
+
+# @desc   Start a bulk import of users and profiles from a CSV or NDJSON file
+# @route  POST / api / admin / users / import
+# @access Admin
+@router.post("/users/import", status_code=status.HTTP_202_ACCEPTED)
+def importUsers(background_tasks: BackgroundTasks, db: db_dependency, file: UploadFile = File(...)):
+    path = save_upload(file, max_size=MAX_IMPORT_SIZE)
+    job = create_import_job(db, filename=file.filename)
+    db.commit()
+
+    background_tasks.add_task(_run_import, job.id, path)
+
+    return {"job_id": job.id, "status": job.status}
+
+# @desc   Get the status and counts of a bulk user import
+# @route  GET / api / admin / users / import / {job_id}
+# @access Admin
+@router.get("/users/import/{job_id}")
+def getImportJob(job_id: int, db: db_dependency):
+    job = get_import_job(db, job_id)
+
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Import job not found"
+        )
+
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "filename": job.filename,
+        "stats": job.stats,
+        "error": job.error,
+        "created_at": job.created_at,
+        "finished_at": job.finished_at,
+    }
@@ -1,8 +1,10 @@
 import logging
 import os
+import time
+from contextlib import asynccontextmanager
 from typing import Dict, Any, List, Annotated
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request
 from pydantic import BaseModel
 
 from langchain_openai import ChatOpenAI
@@ -13,9 +15,17 @@ from sqlalchemy.orm import Session
 
 from Schema.resume_Schema import Resume
 from resumeGenerator import ResumeGenerator
+import resumeImporter
 
 from database import get_db
+from database.database import force_primary, replica_engines, READ_YOUR_WRITES_SECONDS
 from api.auth.route import router as auth_router
+from api.dashboard.route import router as dashboard_router
+from api.export.route import router as export_router
+from api.profile.route import router as profile_router
+from api.resume.route import router as resume_router
+from api.template.route import router as template_router
+from api.admin.route import router as admin_router
 
 # Load environment variables
 load_dotenv()
@@ -28,13 +38,51 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Worker processes for PDF extraction live as long as the app
+    resumeImporter.start_pool()
+    yield
+    resumeImporter.shutdown_pool()
+
+app = FastAPI(lifespan=lifespan)
 
 db_dependency = Annotated[Session, Depends(get_db)]
 
+# Cookie holding the time until which the client's reads go to the primary
+PRIMARY_UNTIL_COOKIE = "primary_until"
+
+@app.middleware("http")
+async def read_your_writes(request: Request, call_next):
+    """Pin a client's reads to the primary for a short window after it writes."""
+    try:
+        primary_until = float(request.cookies.get(PRIMARY_UNTIL_COOKIE, 0))
+    except ValueError:
+        primary_until = 0
+    token = force_primary.set(primary_until > time.time())
+    try:
+        response = await call_next(request)
+    finally:
+        force_primary.reset(token)
+
+    if replica_engines and request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+        response.set_cookie(
+            PRIMARY_UNTIL_COOKIE,
+            str(time.time() + READ_YOUR_WRITES_SECONDS),
+            max_age=int(READ_YOUR_WRITES_SECONDS) + 1,
+            httponly=True,
+        )
+    return response
+
 @app.get('/')
 def root():
     return {"Hello": "World!"}
 
 app.include_router(auth_router, prefix="/api/auth")
+app.include_router(dashboard_router, prefix="/api/dashboard")
+app.include_router(export_router, prefix="/api/export")
+app.include_router(profile_router, prefix="/api/profiles")
+app.include_router(resume_router, prefix="/api/resumes")
+app.include_router(template_router, prefix="/api/templates")
+app.include_router(admin_router, prefix="/api/admin")
 
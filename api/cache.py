@@ -0,0 +1,110 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException, Request, Response, status
+
+import fastJson
+
+
+@dataclass
+class CachedResponse:
+    """A serialized response body with its strong ETag and the row version it was built from."""
+    body: bytes
+    etag: str
+    version: Any
+    checked_at: float
+
+
+class ResponseCache:
+    """
+    Bounded in-process LRU cache of serialized JSON responses.
+
+    Entries checked within `revalidate_after` seconds are served without
+    touching the database. Older entries are revalidated against the row
+    version (its updated_at) and only rebuilt when that has changed.
+    """
+
+    def __init__(self, max_entries: int = 1024, revalidate_after: float = 60.0):
+        self.max_entries = max_entries
+        self.revalidate_after = revalidate_after
+        self._entries: "OrderedDict[Any, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, version, body: bytes) -> CachedResponse:
+        entry = CachedResponse(
+            body=body,
+            etag='"' + hashlib.sha256(body).hexdigest()[:32] + '"',
+            version=version,
+            checked_at=time.monotonic(),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        return time.monotonic() - entry.checked_at < self.revalidate_after
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison as required for If-None-Match (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def cached_json_response(
+    request: Request,
+    cache: ResponseCache,
+    key,
+    load_version: Callable[[], Any],
+    load_payload: Callable[[], Any],
+    cache_control: str,
+) -> Response:
+    """
+    Serve a JSON document from `cache`, answering If-None-Match with 304.
+
+    `load_version` returns the current row version (None when the row does
+    not exist) and should be a cheap query. `load_payload` is only called
+    when the cached body is missing or out of date.
+    """
+    entry = cache.get(key)
+    if entry is None or not cache.is_fresh(entry):
+        version = load_version()
+        if version is None:
+            cache.invalidate(key)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Not found"
+            )
+        if entry is not None and entry.version == version:
+            entry.checked_at = time.monotonic()
+        else:
+            # Encoded once, straight to bytes; the cached body is sent as-is
+            body = fastJson.dumps(load_payload())
+            entry = cache.put(key, version, body)
+
+    headers = {"ETag": entry.etag, "Cache-Control": cache_control}
+    if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
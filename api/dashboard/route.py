@@ -0,0 +1,62 @@
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Annotated
+from pydantic import BaseModel, ConfigDict
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from sqlalchemy.orm import Session
+
+from database import get_db
+from database.repositories.user import get_user_dashboard
+
+router = APIRouter(
+    prefix="",
+    tags=["dashboard"]
+)
+
+db_dependency = Annotated[Session, Depends(get_db)]
+
+class resumeSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    template_id: Optional[int] = None
+    target_job: Optional[Dict[str, Any]] = None
+    job_posting_id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+class profileSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    external_user_id: str
+    personal_info: Dict[str, Any]
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    resumes: List[resumeSummary]
+
+class userDashboard(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    email: str
+    created_at: Optional[datetime] = None
+    profiles: List[profileSummary]
+
+# @desc   Get a user's profiles with their resumes
+# @route  GET / api / dashboard / {user_id}
+# @access Public
+@router.get("/{user_id}", response_model=userDashboard)
+def getDashboard(user_id: int, db: db_dependency):
+    user = get_user_dashboard(db, user_id)
+
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+
+    return user
@@ -0,0 +1,20 @@
+import hmac
+import os
+from typing import Annotated, Optional
+
+from fastapi import Header, HTTPException, status
+
+
+def require_admin(x_admin_token: Annotated[Optional[str], Header()] = None):
+    """Allow the request only if it carries the ADMIN_API_TOKEN from the environment."""
+    admin_token = os.environ.get("ADMIN_API_TOKEN")
+    if not admin_token:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin endpoints are disabled"
+        )
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, admin_token):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid admin token"
+        )
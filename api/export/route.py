@@ -0,0 +1,43 @@
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from database.database import SessionLocal
+from database.repositories.resume import iter_resumes_for_export
+from resumeExporter import EXPORT_FORMATS, stream_export
+
+router = APIRouter(
+    prefix="",
+    tags=["export"]
+)
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "zip": "application/zip",
+}
+
+def _export_body(user_id: int, export_format: str):
+    # The session is owned by the generator rather than the get_db dependency,
+    # so the server-side cursor stays open until the last chunk has been sent.
+    db = SessionLocal()
+    try:
+        yield from stream_export(iter_resumes_for_export(db, user_id=user_id), export_format)
+    finally:
+        db.close()
+
+# @desc   Export all resumes of a user as NDJSON or a ZIP of rendered files
+# @route  GET / api / export / {user_id}
+# @access Public
+@router.get("/{user_id}")
+def exportResumes(user_id: int, format: str = "ndjson"):
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported export format, expected one of: {', '.join(EXPORT_FORMATS)}"
+        )
+
+    filename = f"resumes-{user_id}.{format}"
+    return StreamingResponse(
+        _export_body(user_id, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
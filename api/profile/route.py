@@ -0,0 +1,169 @@
+import os
+import uuid
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Literal, Annotated
+from pydantic import BaseModel, Field, model_validator
+
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+
+from openai import OpenAIError
+from sqlalchemy.exc import DataError
+from sqlalchemy.orm import Session
+
+from database import get_db
+from database import User, UserProfile
+from database.repositories.profile import MAX_PATCH_OPERATIONS, patch_profile_field
+from resumeImporter import ResumeImporter, UnreadableFileError, extract_text
+from api.uploads import save_upload
+
+router = APIRouter(
+    prefix="",
+    tags=["user profile"]
+)
+
+db_dependency = Annotated[Session, Depends(get_db)]
+
+MAX_RESUME_SIZE = 20 * 1024 * 1024
+
+importer = ResumeImporter()
+
+ProfileField = Literal[
+    "personal_info", "work_experience", "education", "skills", "certifications", "projects"
+]
+
+class patchOperation(BaseModel):
+    op: Literal["add", "remove", "replace", "move", "copy", "test"]
+    path: str
+    value: Any = None
+    from_: Optional[str] = Field(default=None, alias="from")
+
+    @model_validator(mode="after")
+    def check_operands(self):
+        if self.op in ("add", "replace", "test") and "value" not in self.model_fields_set:
+            raise ValueError(f'"{self.op}" requires a value')
+        if self.op in ("move", "copy") and self.from_ is None:
+            raise ValueError(f'"{self.op}" requires from')
+        return self
+
+    def as_dict(self) -> Dict[str, Any]:
+        return self.model_dump(by_alias=True, exclude_unset=True)
+
+class profilePatch(BaseModel):
+    # updated_at of the profile the patch was written against
+    updated_at: datetime
+    # RFC 6902 JSON Patch ...
+    operations: Optional[List[patchOperation]] = Field(default=None, max_length=MAX_PATCH_OPERATIONS)
+    # ... or RFC 7396 JSON Merge Patch
+    merge: Any = None
+
+    @model_validator(mode="after")
+    def check_patch(self):
+        if ("operations" in self.model_fields_set) == ("merge" in self.model_fields_set):
+            raise ValueError("Provide exactly one of operations or merge")
+        return self
+
+# @desc   Patch one JSONB field of a profile in place
+# @route  PATCH / api / profiles / {profile_id} / {field}
+# @access Public
+@router.patch("/{profile_id}/{field}")
+def patchProfileField(profile_id: int, field: ProfileField, patch: profilePatch, db: db_dependency):
+    try:
+        updated_at = patch_profile_field(
+            db,
+            profile_id,
+            field,
+            patch.updated_at,
+            operations=[op.as_dict() for op in patch.operations] if patch.operations is not None else None,
+            merge=patch.merge,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    except DataError as e:
+        # e.g. removing "-" from an array
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e.orig).splitlines()[0]
+        )
+
+    if updated_at is None:
+        db.rollback()
+        profile_exists = db.query(UserProfile.id).filter(UserProfile.id == profile_id).first()
+        if not profile_exists:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Profile not found"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Profile was modified since updated_at, a test operation failed or a path does not exist"
+        )
+
+    db.commit()
+
+    return {"id": profile_id, "field": field, "updated_at": updated_at}
+
+# @desc   Create a profile from an uploaded PDF or DOCX resume
+# @route  POST / api / profiles / import
+# @access Public
+@router.post("/import")
+def importProfile(
+    db: db_dependency,
+    user_id: Annotated[int, Form()],
+    file: Annotated[UploadFile, File()],
+    external_user_id: Annotated[Optional[str], Form()] = None,
+):
+    if db.get(User, user_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+
+    path = save_upload(file, max_size=MAX_RESUME_SIZE)
+    try:
+        text = extract_text(path)
+    except UnreadableFileError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=str(e)
+        )
+    finally:
+        os.unlink(path)
+
+    try:
+        parsed = importer.parse_text(text)
+    except (ValueError, OpenAIError) as e:
+        # Fragments the rules could not parse go to the LLM
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Could not parse the resume: {e}"
+        )
+
+    llm_fragments = parsed.pop("llm_fragments")
+    profile = UserProfile(
+        user_id = user_id,
+        external_user_id = external_user_id or uuid.uuid4().hex,
+        **parsed
+    )
+
+    db.add(profile)
+    db.commit()
+    db.refresh(profile)
+
+    return {
+        "id": profile.id,
+        "work_experience": len(profile.work_experience),
+        "education": len(profile.education),
+        "skills": len(profile.skills),
+        "certifications": len(profile.certifications),
+        "projects": len(profile.projects),
+        "llm_fragments": llm_fragments,
+    }
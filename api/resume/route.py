@@ -0,0 +1,131 @@
+from functools import lru_cache
+from typing import Dict, Any, Optional, Annotated
+from pydantic import BaseModel, Field
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from sqlalchemy.orm import Session
+
+from database import get_db
+from database import UserProfile, Resume
+from database.repositories.resume import create_resume, get_resume
+from database.repositories.job_posting import get_or_create_job_posting
+from resumeGenerator import ResumeGenerator
+from api.cache import ResponseCache, cached_json_response
+
+router = APIRouter(
+    prefix="",
+    tags=["resume"]
+)
+
+db_dependency = Annotated[Session, Depends(get_db)]
+
+PROFILE_FIELDS = ("personal_info", "work_experience", "education", "skills", "certifications", "projects")
+
+# Stored resumes do not change once generated
+resume_cache = ResponseCache(max_entries=2048, revalidate_after=600)
+# Resumes hold personal data, so only the browser may keep a copy
+RESUME_CACHE_CONTROL = "private, max-age=3600"
+
+@lru_cache
+def get_generator() -> ResumeGenerator:
+    """Shared generator, so the prompt and chain are only built once per process."""
+    return ResumeGenerator()
+
+class resumeRequest(BaseModel):
+    profile_id: int
+    name: str
+    company_name: str
+    job_role: str
+    job_description: str
+    template_id: Optional[int] = None
+    # Number of candidates to generate and score; the best one is stored.
+    # Extra candidates share one prompt but each adds its completion tokens.
+    candidates: int = Field(default=1, ge=1, le=5)
+
+# @desc   Generate a tailored resume from a profile and store the best candidate
+# @route  POST / api / resumes / generate
+# @access Public
+@router.post("/generate")
+def generateResume(request: resumeRequest, db: db_dependency):
+    profile = db.get(UserProfile, request.profile_id)
+
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+
+    user_profile = {field: getattr(profile, field) for field in PROFILE_FIELDS if getattr(profile, field)}
+
+    # Analysed once per distinct job description and shared by every resume for it
+    posting = get_or_create_job_posting(db, request.job_description)
+    posting_id, requirements, keywords = posting.id, posting.requirements, posting.keywords
+    user_id = profile.user_id
+
+    # End the transaction and hand the connection back before the LLM calls,
+    # so neither a lock nor a snapshot is held while waiting on them. Nothing
+    # loaded above may be read again until the resume is stored, as commit
+    # expires it and reading it would open a new transaction.
+    db.commit()
+    db.close()
+
+    try:
+        resume, score = get_generator().generate_best_resume(
+            user_profile=user_profile,
+            company_name=request.company_name,
+            job_role=request.job_role,
+            job_description=request.job_description,
+            candidates=request.candidates,
+            requirements=requirements,
+            job_keywords=keywords,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=str(e)
+        )
+
+    resume_data: Dict[str, Any] = resume.model_dump()
+    resume_data["ats_score"] = score
+
+    new_resume = create_resume(
+        db,
+        resume_data,
+        user_id = user_id,
+        profile_id = request.profile_id,
+        name = request.name,
+        template_id = request.template_id,
+        target_job = {"company_name": request.company_name, "job_role": request.job_role},
+        job_posting_id = posting_id,
+    )
+    db.commit()
+    db.refresh(new_resume)
+
+    return {"id": new_resume.id, "ats_score": score, "status": "success"}
+
+# @desc   Get a stored resume
+# @route  GET / api / resumes / {resume_id}
+# @access Public
+@router.get("/{resume_id}")
+def getResume(resume_id: int, request: Request, db: db_dependency):
+    def load_version():
+        return db.query(Resume.updated_at).filter(Resume.id == resume_id).scalar()
+
+    def load_payload():
+        resume = get_resume(db, resume_id)
+        return {
+            "id": resume.id,
+            "name": resume.name,
+            "profile_id": resume.profile_id,
+            "template_id": resume.template_id,
+            "job_posting_id": resume.job_posting_id,
+            "target_job": resume.target_job,
+            "resume_data": resume.resume_data,
+            "created_at": resume.created_at,
+            "updated_at": resume.updated_at,
+        }
+
+    return cached_json_response(
+        request, resume_cache, resume_id, load_version, load_payload, RESUME_CACHE_CONTROL
+    )
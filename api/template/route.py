@@ -0,0 +1,75 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Request
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from database import get_db
+from database import ResumeTemplate
+from api.cache import ResponseCache, cached_json_response
+
+router = APIRouter(
+    prefix="",
+    tags=["resume template"]
+)
+
+db_dependency = Annotated[Session, Depends(get_db)]
+
+# Templates almost never change
+template_cache = ResponseCache(max_entries=256, revalidate_after=300)
+TEMPLATE_CACHE_CONTROL = "public, max-age=300, stale-while-revalidate=3600"
+
+def _template_to_dict(template: ResumeTemplate):
+    return {
+        "id": template.id,
+        "name": template.name,
+        "description": template.description,
+        "template_data": template.template_data,
+        "updated_at": template.updated_at,
+    }
+
+# @desc   List active resume templates
+# @route  GET / api / templates
+# @access Public
+@router.get("")
+def listTemplates(request: Request, db: db_dependency):
+    def load_version():
+        # Changes whenever a template is added, edited or (de)activated
+        return tuple(
+            db.query(func.count(ResumeTemplate.id), func.max(ResumeTemplate.updated_at))
+            .filter(ResumeTemplate.is_active.is_(True))
+            .one()
+        )
+
+    def load_payload():
+        templates = (
+            db.query(ResumeTemplate)
+            .filter(ResumeTemplate.is_active.is_(True))
+            .order_by(ResumeTemplate.id)
+            .all()
+        )
+        return [_template_to_dict(template) for template in templates]
+
+    return cached_json_response(
+        request, template_cache, "templates", load_version, load_payload, TEMPLATE_CACHE_CONTROL
+    )
+
+# @desc   Get one resume template
+# @route  GET / api / templates / {template_id}
+# @access Public
+@router.get("/{template_id}")
+def getTemplate(template_id: int, request: Request, db: db_dependency):
+    def load_version():
+        return (
+            db.query(ResumeTemplate.updated_at)
+            .filter(ResumeTemplate.id == template_id)
+            .scalar()
+        )
+
+    def load_payload():
+        return _template_to_dict(db.get(ResumeTemplate, template_id))
+
+    return cached_json_response(
+        request, template_cache, ("template", template_id), load_version, load_payload, TEMPLATE_CACHE_CONTROL
+    )
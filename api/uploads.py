@@ -0,0 +1,27 @@
+import os
+import tempfile
+
+from fastapi import HTTPException, UploadFile, status
+
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def save_upload(upload: UploadFile, max_size: int) -> str:
+    """Stream an upload to a temporary file in chunks and return its path. The caller deletes it."""
+    written = 0
+    with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(upload.filename or "")[1]) as tmp:
+        try:
+            while chunk := upload.file.read(UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if written > max_size:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail="Uploaded file is too large"
+                    )
+                tmp.write(chunk)
+        except HTTPException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    return tmp.name
@@ -0,0 +1,139 @@
+import re
+from collections import Counter
+from typing import Dict, Any, List, Optional
+
+from Schema.resume_Schema import Resume
+
+
+# Keywords taken from the job description
+MAX_KEYWORDS = 40
+# Word count range that fits on one page
+IDEAL_WORDS = (350, 750)
+WEIGHTS = {"keyword_coverage": 0.6, "section_completeness": 0.25, "length": 0.15}
+
+REQUIREMENT_HEADING = re.compile(r"^\s*(requirements|qualifications|what you.ll need|must have|skills)\b.*:?\s*$", re.IGNORECASE)
+HEADING = re.compile(r"^\s*[A-Za-z][\w ,'&/-]{0,60}:\s*$")
+BULLET = re.compile(r"^\s*[-•*·]\s+")
+TOKEN = re.compile(r"[a-z0-9][a-z0-9+#./-]*[a-z0-9+#]|[a-z0-9]")
+STOPWORDS = frozenset("""
+a about above after again all also an and any are as at be been being below between both but by can could
+did do does doing down during each etc few for from further had has have having he her here him his how i if
+in into is it its itself just like looking may me more most must my no nor not now of off on once only or
+other our ours out over own per plus same she should so some such than that the their them then there these
+they this those through to too under until up us very was we well were what when where which while who whom
+why will with within would you your years year experience work working team teams join role ideal candidate
+strong ability responsibilities requirements required preferred including related skills knowledge new
+re ve ll
+""".split())
+
+
+def _tokens(text: str) -> List[str]:
+    tokens = [token.strip("./-") for token in TOKEN.findall(text.lower())]
+    return [
+        token for token in tokens
+        if len(token) > 1 and token not in STOPWORDS and any(char.isalpha() for char in token)
+    ]
+
+
+def extract_keywords(job_description: str, limit: int = MAX_KEYWORDS) -> Dict[str, float]:
+    """Weight the most frequent job description terms (unigrams and bigrams) so they sum to 1."""
+    tokens = _tokens(job_description)
+    counts = Counter(tokens)
+    counts.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+    # A bigram is only a keyword if it repeats
+    terms = [(term, count) for term, count in counts.most_common() if " " not in term or count > 1][:limit]
+    total = sum(count for _, count in terms) or 1
+    return {term: count / total for term, count in terms}
+
+
+def parse_requirements(job_description: str) -> List[str]:
+    """
+    Pull the requirement bullets out of a job description.
+
+    Bullets under a "Requirements"/"Qualifications" style heading are
+    preferred; without one, every bullet in the description is used.
+    """
+    required, bullets = [], []
+    in_requirements = False
+    for line in job_description.splitlines():
+        if REQUIREMENT_HEADING.match(line):
+            in_requirements = True
+        elif HEADING.match(line):
+            in_requirements = False
+        elif BULLET.match(line):
+            item = BULLET.sub("", line).strip()
+            bullets.append(item)
+            if in_requirements:
+                required.append(item)
+    return required or bullets
+
+
+def resume_text(resume: Resume) -> str:
+    """Flatten a resume into plain text."""
+    parts = list(resume.header.values()) + [resume.summary] + resume.skills
+    for section in resume.work_experience + resume.education + resume.additional_sections:
+        parts.append(section.title)
+        parts.extend(section.content)
+    return "\n".join(parts)
+
+
+class ATSScorer:
+    """Score resumes against one job description without calling the LLM."""
+
+    def __init__(self, job_description: str, keywords: Optional[Dict[str, float]] = None):
+        # Keywords precomputed for a shared job posting skip the extraction
+        self.keywords = keywords if keywords is not None else extract_keywords(job_description)
+
+    def _coverage(self, text: str):
+        tokens = _tokens(text)
+        terms = set(tokens) | {f"{a} {b}" for a, b in zip(tokens, tokens[1:])}
+        missing = [term for term in self.keywords if term not in terms]
+        coverage = 1.0 - sum(self.keywords[term] for term in missing)
+        return coverage, missing, len(text.split())
+
+    @staticmethod
+    def _completeness(resume: Resume) -> float:
+        header = {key.lower(): value for key, value in resume.header.items()}
+        checks = [
+            bool(header.get("name")),
+            bool(header.get("email") or header.get("phone")),
+            bool(resume.summary.strip()),
+            bool(resume.work_experience),
+            bool(resume.skills),
+            bool(resume.education),
+        ]
+        return sum(checks) / len(checks)
+
+    @staticmethod
+    def _length(words: int) -> float:
+        low, high = IDEAL_WORDS
+        if words < low:
+            return words / low
+        if words > high:
+            return max(0.0, 1.0 - (words - high) / high)
+        return 1.0
+
+    def score(self, resume: Resume) -> Dict[str, Any]:
+        return self.score_batch([resume])[0]
+
+    def score_batch(self, resumes: List[Resume]) -> List[Dict[str, Any]]:
+        """
+        Score several resumes against the same job description.
+
+        Each score has keyword_coverage, section_completeness and length in
+        [0, 1], their weighted `overall`, the word count and the job
+        keywords the resume is missing.
+        """
+        scores = []
+        for resume in resumes:
+            coverage, missing, words = self._coverage(resume_text(resume))
+            score = {
+                "keyword_coverage": round(coverage, 4),
+                "section_completeness": round(self._completeness(resume), 4),
+                "length": round(self._length(words), 4),
+            }
+            score["overall"] = round(sum(WEIGHTS[name] * score[name] for name in WEIGHTS), 4)
+            score["word_count"] = words
+            score["missing_keywords"] = missing[:10]
+            scores.append(score)
+        return scores
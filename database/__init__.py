@@ -3,5 +3,8 @@ from .models.user import User
 from .models.profile import UserProfile
 from .models.resume import Resume
 from .models.templete import ResumeTemplate
+from .models.section import ResumeSection
+from .models.job_posting import JobPosting
+from .models.import_job import ImportJob
 
 
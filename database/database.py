@@ -1,24 +1,138 @@
+import logging
 import os
+import random
 import sys
+import threading
+import time
+from contextvars import ContextVar
 
 from dotenv import load_dotenv
 
-from sqlalchemy import create_engine, Column, Integer, String, ForeignKey
+from sqlalchemy import create_engine, Column, Integer, String, ForeignKey, Select
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import text
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+import fastJson
 
 load_dotenv()
 
-engine = create_engine(
-    str(os.environ.get("POSTGRES_URI")),
+logger = logging.getLogger(__name__)
+
+ENGINE_OPTIONS = dict(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
     pool_recycle=3600,
+    # Encode/decode JSONB columns with orjson when it is installed
+    json_serializer=fastJson.dumps_str,
+    json_deserializer=fastJson.loads,
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+engine = create_engine(str(os.environ.get("POSTGRES_URI")), **ENGINE_OPTIONS)
+
+# Optional read replicas, comma separated. A session reads from one replica
+# in a single REPEATABLE READ transaction, so all of its reads share a snapshot.
+replica_engines = [
+    create_engine(uri.strip(), isolation_level="REPEATABLE READ", **ENGINE_OPTIONS)
+    for uri in os.environ.get("POSTGRES_REPLICA_URIS", "").split(",")
+    if uri.strip()
+]
+# Replicas further behind the primary than this are taken out of rotation
+REPLICA_MAX_LAG_SECONDS = float(os.environ.get("REPLICA_MAX_LAG_SECONDS", "5"))
+REPLICA_HEALTH_INTERVAL = float(os.environ.get("REPLICA_HEALTH_INTERVAL", "5"))
+# How long a client's reads stay on the primary after it wrote something
+READ_YOUR_WRITES_SECONDS = float(os.environ.get("READ_YOUR_WRITES_SECONDS", "5"))
+
+# Set to True to send every query of the current request to the primary
+force_primary: ContextVar[bool] = ContextVar("force_primary", default=False)
+
+REPLICA_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE coalesce(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+_healthy_replicas = []
+_health_lock = threading.Lock()
+_health_thread = None
+
+
+def check_replicas():
+    """
+    Measure the lag of every replica and update the rotation.
+
+    A replica that cannot be reached or lags more than
+    REPLICA_MAX_LAG_SECONDS is removed until a later check finds it healthy.
+    An instance that is not in recovery counts as zero lag, which lets a
+    second local Postgres stand in for a replica. Returns {url: lag or None}.
+    """
+    global _healthy_replicas
+    status, healthy = {}, []
+    for replica in replica_engines:
+        try:
+            with replica.connect() as connection:
+                lag = float(connection.execute(REPLICA_LAG_QUERY).scalar())
+        except SQLAlchemyError as e:
+            logger.warning("Replica %s is unreachable: %s", replica.url, e)
+            lag = None
+        status[str(replica.url)] = lag
+        if lag is not None and lag <= REPLICA_MAX_LAG_SECONDS:
+            healthy.append(replica)
+        elif lag is not None:
+            logger.warning("Replica %s lags %.1fs behind the primary", replica.url, lag)
+
+    with _health_lock:
+        _healthy_replicas = healthy
+    return status
+
+
+def _run_health_checks():
+    while True:
+        time.sleep(REPLICA_HEALTH_INTERVAL)
+        check_replicas()
+
+
+def _pick_replica():
+    """Return a healthy replica engine, or None to use the primary."""
+    global _health_thread
+    if not replica_engines:
+        return None
+    if _health_thread is None:
+        with _health_lock:
+            if _health_thread is None:
+                _health_thread = threading.Thread(target=_run_health_checks, name="replica-health", daemon=True)
+                _health_thread.start()
+        check_replicas()
+    with _health_lock:
+        return random.choice(_healthy_replicas) if _healthy_replicas else None
+
+
+class RoutingSession(Session):
+    """
+    Session that sends plain SELECTs to a replica and everything else to the primary.
+
+    The replica is picked once per session, so a row and the rows loaded
+    to complete it (sections, versions) come from the same replica. Once a
+    session writes, it stays on the primary so it reads its own writes.
+    Requests flagged with `force_primary` never use a replica.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.info.get("use_primary") or force_primary.get():
+            return engine
+        if self._flushing or not isinstance(clause, Select) or clause._for_update_arg is not None:
+            self.info["use_primary"] = True
+            return engine
+        if "replica" not in self.info:
+            self.info["replica"] = _pick_replica()
+        return self.info["replica"] or engine
+
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=RoutingSession)
 
 Base = declarative_base()
 
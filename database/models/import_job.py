@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+# Use relative import for Base
+from ..database import Base
+
+class ImportJob(Base):
+    """A bulk user import running in the background."""
+    __tablename__ = "import_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    status = Column(String, nullable=False, default="pending")  # pending, running, succeeded, failed
+    filename = Column(String, nullable=True)
+
+    # Counts from userImporter.import_users, updated after every chunk
+    stats = Column(JSONB, nullable=True)
+    error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
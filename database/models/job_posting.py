@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+# Use relative import for Base
+from ..database import Base
+
+class JobPosting(Base):
+    """A job description shared by every resume that targets it, analysed once at ingest."""
+    __tablename__ = "job_postings"
+
+    id = Column(Integer, primary_key=True, index=True)
+    # SHA-256 of the normalized job description
+    content_hash = Column(String(64), unique=True, index=True, nullable=False)
+    description = Column(Text, nullable=False)
+
+    # Precomputed analysis, reused by every resume generated for this posting
+    keywords = Column(JSONB, nullable=True)  # {term: weight}
+    requirements = Column(JSONB, nullable=True)  # list of requirement lines
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
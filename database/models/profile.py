@@ -11,7 +11,7 @@ class UserProfile(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     # Correct FK definition for one-to-many
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Review if external_user_id is still needed or should be user_id
     # If it's a separate ID from another system, keep it.
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -8,17 +8,23 @@ from ..database import Base
 
 class Resume(Base):
     __tablename__ = "resume"
+    __table_args__ = (
+        # A user's resumes in id order, as exported
+        Index("ix_resume_user_id_id", "user_id", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     # Add user_id FK based on the change to UserProfile
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    profile_id = Column(Integer, ForeignKey("user_profile.id", ondelete="CASCADE"), nullable=False)
+    profile_id = Column(Integer, ForeignKey("user_profile.id", ondelete="CASCADE"), nullable=False, index=True)
 
     name = Column(String, nullable=False) #name of the resume
     template_id = Column(Integer, ForeignKey("resume_templates.id"), nullable=True)
 
-    # Store the job details this resume was generated for
+    # The company and role this resume was generated for
     target_job = Column(JSONB, nullable=True)
+    # The shared job description and its analysis
+    job_posting_id = Column(Integer, ForeignKey("job_postings.id"), nullable=True, index=True)
 
     resume_data = Column(JSONB, nullable=False)
 
@@ -28,3 +34,4 @@ class Resume(Base):
     # Relationship - Use string references "UserProfile" and "ResumeTemplate"
     profile = relationship("UserProfile", back_populates="resumes")
     template = relationship("ResumeTemplate") # Assuming ResumeTemplate doesn't back-populate
+    job_posting = relationship("JobPosting")
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+# Use relative import for Base
+from ..database import Base
+
+class ResumeSection(Base):
+    """Content-addressed store for resume sections shared between resumes."""
+    __tablename__ = "resume_sections"
+
+    # SHA-256 of the canonical JSON encoding of `content`
+    hash = Column(String(64), primary_key=True)
+    content = Column(JSONB, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Bumped every time a resume stores this section, so garbage collection
+    # never deletes a section a resume is being created with
+    last_stored_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
@@ -0,0 +1,24 @@
+from typing import Dict, Any, Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+# Use relative imports for the models
+from ..models.import_job import ImportJob
+
+
+def create_import_job(db: Session, filename: Optional[str] = None) -> ImportJob:
+    """Add a pending import job. The caller commits."""
+    job = ImportJob(status="pending", filename=filename)
+    db.add(job)
+    return job
+
+
+def update_import_job(db: Session, job_id: int, **fields: Any):
+    """Set columns of an import job (status, stats, error, finished_at) and commit."""
+    db.execute(update(ImportJob).where(ImportJob.id == job_id).values(**fields))
+    db.commit()
+
+
+def get_import_job(db: Session, job_id: int) -> Optional[ImportJob]:
+    return db.get(ImportJob, job_id)
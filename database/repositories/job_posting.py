@@ -0,0 +1,61 @@
+import hashlib
+from typing import Dict, Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from atsScorer import extract_keywords, parse_requirements
+
+# Use relative imports for the models
+from ..models.job_posting import JobPosting
+
+
+def description_hash(description: str) -> str:
+    """Hash a job description with its whitespace normalized."""
+    normalized = " ".join(description.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def analyse_job_description(description: str) -> Dict[str, Any]:
+    """Compute the keywords and requirements resume generation feeds into the prompt and scorer."""
+    return {
+        "keywords": extract_keywords(description),
+        "requirements": parse_requirements(description),
+    }
+
+
+def get_or_create_job_posting(db: Session, description: str) -> JobPosting:
+    """
+    Return the shared posting for a job description, creating it on first use.
+
+    The description is analysed only when the posting is created (or when
+    it was backfilled without an analysis), so every later resume for the
+    same posting reuses the stored keywords and requirements. Company and
+    role are not part of the posting; they stay on each resume. The caller
+    commits.
+    """
+    digest = description_hash(description)
+    posting = db.execute(
+        select(JobPosting).where(JobPosting.content_hash == digest)
+    ).scalar_one_or_none()
+
+    if posting is None:
+        db.execute(
+            insert(JobPosting)
+            .values(
+                content_hash=digest,
+                description=description,
+                **analyse_job_description(description),
+            )
+            .on_conflict_do_nothing(index_elements=["content_hash"])
+        )
+        posting = db.execute(
+            select(JobPosting).where(JobPosting.content_hash == digest)
+        ).scalar_one()
+    elif posting.keywords is None:
+        for key, value in analyse_job_description(posting.description).items():
+            setattr(posting, key, value)
+        db.flush()
+
+    return posting
@@ -0,0 +1,281 @@
+import re
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from sqlalchemy import Text, and_, case, cast, func, literal, select, true, update
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import Session
+
+# Use relative imports for the models
+from ..models.profile import UserProfile
+
+# JSONB columns that can be patched, with the value used when a nullable column is empty
+PATCHABLE_FIELDS = {
+    "personal_info": {},
+    "work_experience": [],
+    "education": [],
+    "skills": [],
+    "certifications": [],
+    "projects": [],
+}
+
+# Upper bound on the operations of one JSON Patch
+MAX_PATCH_OPERATIONS = 100
+
+# An RFC 6901 array index: no sign, no leading zeros
+ARRAY_INDEX = re.compile(r"^(0|[1-9][0-9]*)$")
+
+
+class InvalidPatchError(ValueError):
+    """A JSON Patch path indexes an array with something other than an RFC 6901 index."""
+
+
+def _jsonb(value: Any):
+    return literal(value, type_=JSONB)
+
+
+def _text(value: str):
+    return cast(literal(value, type_=Text), Text)
+
+
+def _path(path: List[str]):
+    return cast(literal(path, type_=ARRAY(Text)), ARRAY(Text))
+
+
+def _parse_pointer(pointer: str) -> List[str]:
+    """Split an RFC 6901 JSON pointer into a Postgres text[] path."""
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer: {pointer!r}")
+    return [part.replace("~1", "/").replace("~0", "~") for part in pointer[1:].split("/")]
+
+
+def _get(expr, path: List[str]):
+    return expr.op("#>", return_type=JSONB)(_path(path))
+
+
+def _exists(expr, path: List[str]):
+    return _get(expr, path).is_not(None)
+
+
+def _is_array(expr, path: List[str]):
+    return func.jsonb_typeof(_get(expr, path)) == "array"
+
+
+def _index_checks(expr, path: List[str], append: bool = False):
+    """
+    Conditions that every segment of `path` whose parent is an array is an RFC 6901 index.
+
+    Postgres reads "-1" as the last element and "01" as 1, so those are
+    only accepted as object keys. "-" is accepted as the last segment
+    when `append` is set (the target of "add", "copy" and "move").
+    """
+    checks = []
+    for i, segment in enumerate(path):
+        if ARRAY_INDEX.match(segment) or (append and segment == "-" and i == len(path) - 1):
+            continue
+        checks.append(func.coalesce(func.jsonb_typeof(_get(expr, path[:i])), "") != "array")
+    return checks
+
+
+def _step(value, outer):
+    """Bind an intermediate patch value once, so the next operation can refer to it by name."""
+    # OFFSET 0 keeps the planner from inlining the steps back into one
+    # nested expression, which would double its size with every "move"
+    return select(value.label("value")).correlate(*outer).offset(0).lateral()
+
+
+def _add(expr, path: List[str], value):
+    """RFC 6902 "add": insert into arrays, set object members."""
+    if not path:
+        return value
+    parent, last = path[:-1], path[-1]
+    set_member = func.jsonb_set(expr, _path(path), value, True, type_=JSONB)
+    if last == "-":
+        insert = func.jsonb_insert(expr, _path(parent + ["-1"]), value, True, type_=JSONB)
+    elif ARRAY_INDEX.match(last):
+        insert = func.jsonb_insert(expr, _path(path), value, type_=JSONB)
+    else:
+        return set_member
+    # "-" and numbers are plain keys when the parent is an object
+    return case((_is_array(expr, parent), insert), else_=set_member)
+
+
+def _insert_in_range(expr, path: List[str]):
+    """An "add" index may be at most the array length; jsonb_insert would append instead."""
+    if not path or not ARRAY_INDEX.match(path[-1]):
+        return true()
+    parent = _get(expr, path[:-1])
+    return case(
+        (func.jsonb_typeof(parent) == "array", func.jsonb_array_length(parent) >= int(path[-1])),
+        else_=true(),
+    )
+
+
+def _remove(expr, path: List[str]):
+    return expr.op("#-", return_type=JSONB)(_path(path))
+
+
+def _replace(expr, path: List[str], value):
+    if not path:
+        return value
+    return func.jsonb_set(expr, _path(path), value, False, type_=JSONB)
+
+
+def json_patch_steps(current, operations: List[Dict[str, Any]], table=UserProfile.__table__):
+    """
+    Translate an RFC 6902 JSON Patch into a chain of LATERAL subqueries.
+
+    Each operation reads the previous step by reference, so the SQL grows
+    linearly with the patch even though "move" uses the value twice.
+    Returns the steps, the conditions the patch requires and the
+    conditions its array indices are valid. The patch requires that every
+    "test" holds and that every path that is read, removed, replaced or
+    added into exists, so the whole patch fails instead of skipping an
+    operation. Each step is correlated to `table` and the steps before it.
+    """
+    steps = [_step(current, [table])]
+    conditions, index_checks = [], []
+    for operation in operations:
+        op = operation.get("op")
+        path = _parse_pointer(operation.get("path", ""))
+        value = steps[-1].c.value
+
+        if op == "add":
+            conditions.extend([_exists(value, path[:-1]), _insert_in_range(value, path)])
+            index_checks.extend(_index_checks(value, path, append=True))
+            value = _add(value, path, _jsonb(operation["value"]))
+        elif op == "remove":
+            conditions.append(_exists(value, path))
+            index_checks.extend(_index_checks(value, path))
+            value = _remove(value, path)
+        elif op == "replace":
+            conditions.append(_exists(value, path))
+            index_checks.extend(_index_checks(value, path))
+            value = _replace(value, path, _jsonb(operation["value"]))
+        elif op == "copy":
+            source = _parse_pointer(operation["from"])
+            conditions.extend([_exists(value, source), _exists(value, path[:-1]), _insert_in_range(value, path)])
+            index_checks.extend(_index_checks(value, source) + _index_checks(value, path, append=True))
+            value = _add(value, path, _get(value, source))
+        elif op == "move":
+            source = _parse_pointer(operation["from"])
+            conditions.extend([_exists(value, source), _exists(value, path[:-1]), _insert_in_range(value, path)])
+            index_checks.extend(_index_checks(value, source) + _index_checks(value, path, append=True))
+            value = _add(_remove(value, source), path, _get(value, source))
+        elif op == "test":
+            conditions.append(_get(value, path) == _jsonb(operation["value"]))
+            index_checks.extend(_index_checks(value, path))
+            continue
+        else:
+            raise ValueError(f"Unsupported JSON Patch operation: {op!r}")
+        steps.append(_step(value, [table, *steps]))
+    return steps, conditions, index_checks
+
+
+def merge_patch_expression(target, patch: Any):
+    """Translate an RFC 7396 JSON Merge Patch into a single JSONB expression."""
+    if not isinstance(patch, dict):
+        return _jsonb(patch)
+
+    expr = case(
+        (func.jsonb_typeof(target) == "object", target),
+        else_=_jsonb({}),
+    )
+    for key, value in patch.items():
+        if value is None:
+            expr = expr.op("-", return_type=JSONB)(_text(key))
+        else:
+            merged = merge_patch_expression(target.op("->", return_type=JSONB)(_text(key)), value)
+            expr = expr.op("||", return_type=JSONB)(func.jsonb_build_object(_text(key), merged, type_=JSONB))
+    return expr
+
+
+def patch_statement(
+    profile_id: int,
+    field: str,
+    expected_updated_at: datetime,
+    operations: Optional[List[Dict[str, Any]]] = None,
+    merge: Any = None,
+):
+    """
+    Build the statement patch_profile_field runs.
+
+    It updates the profile if every condition holds and selects the new
+    updated_at (NULL when nothing was updated) along with whether the
+    array indices of the patch were valid.
+    """
+    if field not in PATCHABLE_FIELDS:
+        raise ValueError(f"Field {field!r} cannot be patched")
+    if operations is not None and len(operations) > MAX_PATCH_OPERATIONS:
+        raise ValueError(f"A patch may have at most {MAX_PATCH_OPERATIONS} operations")
+
+    column = getattr(UserProfile, field)
+    current = func.coalesce(column, _jsonb(PATCHABLE_FIELDS[field]))
+
+    if operations is not None:
+        steps, conditions, index_checks = json_patch_steps(current, operations)
+    else:
+        steps, conditions, index_checks = [_step(merge_patch_expression(current, merge), [UserProfile.__table__])], [], []
+
+    source = UserProfile.__table__
+    for step in steps:
+        source = source.join(step, true())
+    patched = (
+        select(
+            UserProfile.id,
+            steps[-1].c.value,
+            and_(true(), *conditions).label("ok"),
+            and_(true(), *index_checks).label("valid"),
+        )
+        .select_from(source)
+        .where(UserProfile.id == profile_id)
+        .cte("patched")
+    )
+
+    updated = (
+        update(UserProfile)
+        .where(
+            UserProfile.id == patched.c.id,
+            UserProfile.updated_at == expected_updated_at,
+            patched.c.ok,
+            patched.c.valid,
+        )
+        .values({field: patched.c.value, "updated_at": func.now()})
+        .returning(UserProfile.updated_at)
+        .cte("updated")
+    )
+    # Report the index check alongside the update, so an invalid path is not mistaken for a conflict
+    return (
+        select(updated.c.updated_at, patched.c.valid)
+        .select_from(patched.outerjoin(updated, true()))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def patch_profile_field(
+    db: Session,
+    profile_id: int,
+    field: str,
+    expected_updated_at: datetime,
+    operations: Optional[List[Dict[str, Any]]] = None,
+    merge: Any = None,
+) -> Optional[datetime]:
+    """
+    Apply a JSON Patch (`operations`) or a Merge Patch (`merge`) to one profile column.
+
+    The patch is applied by Postgres in a single statement that writes only
+    `field` and `updated_at`, and only if the row still has
+    `expected_updated_at` and every condition of the patch holds. Returns
+    the new updated_at, or None when the profile is missing or a check
+    failed. A path that indexes an array with anything but an RFC 6901
+    index raises InvalidPatchError. The caller commits.
+    """
+    stmt = patch_statement(profile_id, field, expected_updated_at, operations, merge)
+    row = db.execute(stmt).one_or_none()
+    if row is None:
+        return None
+    if not row.valid:
+        raise InvalidPatchError("A path indexes an array with something other than an array index")
+    return row.updated_at
@@ -0,0 +1,95 @@
+from typing import Dict, Any, Iterator, Optional
+
+from sqlalchemy import case, func, literal, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session
+
+# Use relative imports for the models
+from ..models.resume import Resume
+from ..models.job_posting import JobPosting
+from .section import store_resume_data, assemble_many
+
+
+def create_resume(db: Session, resume_data: Dict[str, Any], **fields) -> Resume:
+    """
+    Add a resume, storing its shareable sections in the section store.
+
+    `fields` are the remaining Resume columns (user_id, profile_id, name,
+    template_id, target_job, job_posting_id). The caller commits.
+    """
+    resume = Resume(resume_data=store_resume_data(db, resume_data), **fields)
+    db.add(resume)
+    return resume
+
+
+def target_job(resume: Resume) -> Optional[Dict[str, Any]]:
+    """The resume's company and role joined with the description of its shared job posting."""
+    if resume.job_posting is None:
+        return resume.target_job
+    return {**(resume.target_job or {}), "job_description": resume.job_posting.description}
+
+
+def get_resume(db: Session, resume_id: int) -> Optional[Resume]:
+    """
+    Load a resume with its resume_data reassembled from the section store
+    and the job description of its shared posting added to its target_job.
+    """
+    resume = db.get(Resume, resume_id)
+    if resume is not None:
+        job = target_job(resume)
+        # The reassembled document is for reading only, never write it back
+        db.expunge(resume)
+        resume.target_job = job
+        resume.resume_data = assemble_many(db, [resume.resume_data])[0]
+    return resume
+
+
+def iter_resumes_for_export(
+    db: Session,
+    user_id: Optional[int] = None,
+    batch_size: int = 100,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream resumes row by row through a server-side cursor.
+
+    Rows are fetched `batch_size` at a time and returned as plain
+    dictionaries instead of ORM objects, so nothing accumulates in the
+    session and memory stays flat however many resumes are exported. The
+    sections of each batch are reassembled with a single lookup, and the
+    job descriptions are joined in from the shared job postings. Pass no
+    `user_id` to export every user's resumes.
+    """
+    stmt = (
+        select(
+            Resume.id,
+            Resume.user_id,
+            Resume.profile_id,
+            Resume.name,
+            Resume.template_id,
+            Resume.job_posting_id,
+            case(
+                (
+                    JobPosting.id.is_not(None),
+                    func.coalesce(Resume.target_job, literal({}, type_=JSONB)).op("||", return_type=JSONB)(
+                        func.jsonb_build_object("job_description", JobPosting.description)
+                    ),
+                ),
+                else_=Resume.target_job,
+            ).label("target_job"),
+            Resume.resume_data,
+            Resume.created_at,
+            Resume.updated_at,
+        )
+        .outerjoin(JobPosting, Resume.job_posting_id == JobPosting.id)
+        .order_by(Resume.id)
+        .execution_options(stream_results=True, yield_per=batch_size)
+    )
+    if user_id is not None:
+        stmt = stmt.where(Resume.user_id == user_id)
+
+    for partition in db.execute(stmt).mappings().partitions():
+        records = [dict(row) for row in partition]
+        documents = assemble_many(db, [record["resume_data"] for record in records])
+        for record, resume_data in zip(records, documents):
+            record["resume_data"] = resume_data
+            yield record
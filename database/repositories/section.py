@@ -0,0 +1,195 @@
+import hashlib
+import json
+from datetime import timedelta
+from typing import Dict, Any, Iterable, List, Set
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+# Use relative imports for the models
+from ..models.section import ResumeSection
+
+# resume_data fields stored as a single shared section
+SECTION_FIELDS = ("header",)
+# resume_data fields whose items are each stored as a shared section
+LIST_SECTION_FIELDS = ("work_experience", "education", "additional_sections")
+
+REF_KEY = "$ref"
+
+# Unreferenced sections younger than this are kept. It must exceed the
+# longest transaction that stores a resume plus LAST_STORED_REFRESH, see
+# delete_unreferenced_sections.
+GC_GRACE_PERIOD = timedelta(hours=1)
+# last_stored_at is only bumped once it is older than this, so storing a
+# shared section again does not rewrite its row on every save
+LAST_STORED_REFRESH = GC_GRACE_PERIOD / 4
+
+
+def section_hash(content: Any) -> str:
+    """Hash the canonical JSON encoding of a section."""
+    canonical = json.dumps(content, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _is_ref(value: Any) -> bool:
+    return isinstance(value, dict) and len(value) == 1 and REF_KEY in value
+
+
+def split_resume_data(resume_data: Dict[str, Any]):
+    """
+    Replace the shareable sections of resume_data with {"$ref": hash} references.
+
+    Returns the referencing document and a {hash: content} map of the
+    sections it points to. Fields that are tailored per job (summary,
+    skills, ...) stay inline.
+    """
+    sections: Dict[str, Any] = {}
+
+    def ref(content):
+        if _is_ref(content):
+            return content
+        digest = section_hash(content)
+        sections[digest] = content
+        return {REF_KEY: digest}
+
+    refs = dict(resume_data)
+    for field in SECTION_FIELDS:
+        if field in refs:
+            refs[field] = ref(refs[field])
+    for field in LIST_SECTION_FIELDS:
+        if field in refs:
+            refs[field] = [ref(item) for item in refs[field]]
+
+    return refs, sections
+
+
+def _collect_hashes(resume_data: Dict[str, Any], hashes: Set[str]):
+    for field in SECTION_FIELDS:
+        if _is_ref(resume_data.get(field)):
+            hashes.add(resume_data[field][REF_KEY])
+    for field in LIST_SECTION_FIELDS:
+        for item in resume_data.get(field) or []:
+            if _is_ref(item):
+                hashes.add(item[REF_KEY])
+
+
+def assemble_resume_data(resume_data: Dict[str, Any], sections: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replace section references with their content. Inline documents are returned unchanged.
+
+    Raises LookupError when a referenced section is missing from `sections`.
+    """
+    def resolve(value):
+        if not _is_ref(value):
+            return value
+        try:
+            return sections[value[REF_KEY]]
+        except KeyError:
+            raise LookupError(f"Resume section {value[REF_KEY]} is missing from the section store") from None
+
+    assembled = dict(resume_data)
+    for field in SECTION_FIELDS:
+        if field in assembled:
+            assembled[field] = resolve(assembled[field])
+    for field in LIST_SECTION_FIELDS:
+        if field in assembled:
+            assembled[field] = [resolve(item) for item in assembled[field]]
+    return assembled
+
+
+def store_resume_data(db: Session, resume_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Store the sections of resume_data and return the referencing document.
+
+    Storing the same header or education entry for many resumes keeps a
+    single copy. Sections that already exist are left as they are, unless
+    their last_stored_at is older than LAST_STORED_REFRESH and is bumped.
+    Rows are upserted in hash order, so concurrent saves of overlapping
+    sections lock them in the same order and cannot deadlock.
+    """
+    refs, sections = split_resume_data(resume_data)
+    if sections:
+        stmt = insert(ResumeSection).values(
+            [{"hash": digest, "content": sections[digest]} for digest in sorted(sections)]
+        ).on_conflict_do_update(
+            index_elements=["hash"],
+            set_={"last_stored_at": func.now()},
+            where=ResumeSection.last_stored_at < func.now() - LAST_STORED_REFRESH,
+        )
+        db.execute(stmt)
+    return refs
+
+
+def load_sections(db: Session, hashes: Iterable[str]) -> Dict[str, Any]:
+    """Fetch section contents by hash in a single query."""
+    hashes = list(hashes)
+    if not hashes:
+        return {}
+    rows = db.execute(
+        select(ResumeSection.hash, ResumeSection.content).where(ResumeSection.hash.in_(hashes))
+    )
+    return {digest: content for digest, content in rows}
+
+
+def assemble_many(db: Session, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Reassemble a batch of stored resume_data documents with one section lookup."""
+    hashes: Set[str] = set()
+    for document in documents:
+        _collect_hashes(document, hashes)
+    sections = load_sections(db, hashes)
+    return [assemble_resume_data(document, sections) for document in documents]
+
+
+def delete_unreferenced_sections(db: Session, grace_period: timedelta = GC_GRACE_PERIOD) -> int:
+    """
+    Delete the sections no resume references any more and return how many.
+
+    Sections are left behind when resumes are deleted, directly or through
+    their profile or user, and the header section holds personal details,
+    so this should run periodically (scripts/gc_sections.py).
+
+    A section a resume is being stored with had its last_stored_at set
+    within LAST_STORED_REFRESH of that transaction; keeping sections
+    stored within `grace_period` covers the resumes whose transaction is
+    still open. The caller commits.
+    """
+    if grace_period <= LAST_STORED_REFRESH:
+        raise ValueError(f"The grace period must be longer than {LAST_STORED_REFRESH}")
+    result = db.execute(text("""
+        DELETE FROM resume_sections s
+        WHERE s.last_stored_at < now() - :grace_period
+        AND NOT EXISTS (
+            SELECT 1
+            FROM resume, jsonb_path_query(resume.resume_data, 'strict $.**."$ref"') AS ref
+            WHERE ref #>> '{}' = s.hash
+        )
+    """), {"grace_period": grace_period})
+    return result.rowcount
+
+
+def get_dedup_stats(db: Session) -> Dict[str, Any]:
+    """
+    Report how much storage the section store saves.
+
+    `dedup_ratio` is the number of section references held by resumes
+    divided by the number of distinct sections actually stored.
+    """
+    row = db.execute(text("""
+        WITH refs AS (
+            SELECT ref #>> '{}' AS hash
+            FROM resume, jsonb_path_query(resume.resume_data, 'strict $.**."$ref"') AS ref
+        )
+        SELECT
+            count(*) AS section_refs,
+            coalesce(sum(octet_length(s.content::text)), 0) AS logical_bytes,
+            (SELECT count(*) FROM resume_sections) AS unique_sections,
+            (SELECT coalesce(sum(octet_length(content::text)), 0) FROM resume_sections) AS stored_bytes
+        FROM refs JOIN resume_sections s ON s.hash = refs.hash
+    """)).mappings().one()
+
+    stats = dict(row)
+    stats["dedup_ratio"] = (
+        round(stats["section_refs"] / stats["unique_sections"], 2) if stats["unique_sections"] else 0.0
+    )
+    return stats
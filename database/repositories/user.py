@@ -0,0 +1,50 @@
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, load_only, selectinload
+
+# Use relative imports for the models
+from ..models.user import User
+from ..models.profile import UserProfile
+from ..models.resume import Resume
+
+
+def get_user_dashboard(db: Session, user_id: int) -> Optional[User]:
+    """
+    Load a user with all of their profiles and resumes.
+
+    The whole tree is fetched in three queries (user, profiles, resumes)
+    however many profiles or resumes exist. Only the columns the dashboard
+    shows are selected, so the large JSONB documents (work experience,
+    education, resume_data, ...) are never read. A resume's target_job only
+    holds its company and role; the job description stays in the shared
+    posting, which is not loaded.
+    """
+    stmt = (
+        select(User)
+        .where(User.id == user_id)
+        .options(
+            load_only(User.id, User.name, User.email, User.created_at),
+            selectinload(User.profiles)
+            .load_only(
+                UserProfile.id,
+                UserProfile.user_id,
+                UserProfile.external_user_id,
+                UserProfile.personal_info,
+                UserProfile.created_at,
+                UserProfile.updated_at,
+            )
+            .selectinload(UserProfile.resumes)
+            .load_only(
+                Resume.id,
+                Resume.profile_id,
+                Resume.name,
+                Resume.template_id,
+                Resume.target_job,
+                Resume.job_posting_id,
+                Resume.created_at,
+                Resume.updated_at,
+            ),
+        )
+    )
+    return db.execute(stmt).scalar_one_or_none()
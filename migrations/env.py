@@ -8,7 +8,7 @@ from sqlalchemy import pool
 from alembic import context
 
 from database.database import Base
-from database import UserProfile, User, Resume, ResumeTemplate
+from database import UserProfile, User, Resume, ResumeTemplate, ResumeSection, JobPosting, ImportJob
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,120 @@
+"""add_job_postings
+
+Revision ID: 09763db92bc0
+Revises: 4f6aa1c2a6fa
+Create Date: 2026-10-19 14:03:12.730514
+
+"""
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '09763db92bc0'
+down_revision: Union[str, None] = '4f6aa1c2a6fa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+resume = sa.table(
+    'resume',
+    sa.column('id', sa.Integer()),
+    sa.column('job_posting_id', sa.Integer()),
+    sa.column('target_job', postgresql.JSONB()),
+)
+job_postings = sa.table(
+    'job_postings',
+    sa.column('id', sa.Integer()),
+    sa.column('content_hash', sa.String()),
+    sa.column('description', sa.Text()),
+)
+
+
+def _description_hash(description):
+    # Frozen copy of database.repositories.job_posting.description_hash
+    normalized = " ".join(description.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job_postings',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('keywords', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('requirements', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_job_postings_content_hash'), 'job_postings', ['content_hash'], unique=True)
+    op.create_index(op.f('ix_job_postings_id'), 'job_postings', ['id'], unique=False)
+    op.add_column('resume', sa.Column('job_posting_id', sa.Integer(), nullable=True))
+    op.create_index(op.f('ix_resume_job_posting_id'), 'resume', ['job_posting_id'], unique=False)
+    op.create_foreign_key('resume_job_posting_id_fkey', 'resume', 'job_postings', ['job_posting_id'], ['id'])
+
+    # Backfill: move the job description copied onto each resume into shared
+    # postings. The company and role stay on the resume. Keywords and
+    # requirements are left empty and computed on first use.
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(resume.c.id, resume.c.target_job)
+            .where(resume.c.id > last_id)
+            .where(resume.c.target_job.has_key('job_description'))
+            .order_by(resume.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        postings, resume_hashes = {}, []
+        for row in rows:
+            description = row.target_job.get('job_description') or ''
+            digest = _description_hash(description)
+            postings.setdefault(digest, {'content_hash': digest, 'description': description})
+            resume_hashes.append((row.id, digest))
+
+        connection.execute(
+            postgresql.insert(job_postings)
+            .values(list(postings.values()))
+            .on_conflict_do_nothing(index_elements=['content_hash'])
+        )
+        posting_ids = dict(connection.execute(
+            sa.select(job_postings.c.content_hash, job_postings.c.id)
+            .where(job_postings.c.content_hash.in_(list(postings)))
+        ).all())
+        connection.execute(
+            resume.update()
+            .where(resume.c.id == sa.bindparam('row_id'))
+            .values(
+                job_posting_id=sa.bindparam('posting_id'),
+                target_job=resume.c.target_job.op('-', return_type=postgresql.JSONB)(
+                    sa.cast(sa.literal('job_description'), sa.Text)
+                ),
+            ),
+            [{'row_id': row_id, 'posting_id': posting_ids[digest]} for row_id, digest in resume_hashes],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Copy the job descriptions back onto the resumes before dropping the postings
+    op.execute("""
+        UPDATE resume SET target_job = coalesce(resume.target_job, '{}'::jsonb)
+            || jsonb_build_object('job_description', p.description)
+        FROM job_postings p
+        WHERE resume.job_posting_id = p.id
+    """)
+    op.drop_constraint('resume_job_posting_id_fkey', 'resume', type_='foreignkey')
+    op.drop_index(op.f('ix_resume_job_posting_id'), table_name='resume')
+    op.drop_column('resume', 'job_posting_id')
+    op.drop_index(op.f('ix_job_postings_id'), table_name='job_postings')
+    op.drop_index(op.f('ix_job_postings_content_hash'), table_name='job_postings')
+    op.drop_table('job_postings')
@@ -0,0 +1,30 @@
+"""add_resume_sections_last_stored_at
+
+Revision ID: 405c77a3cdd6
+Revises: 09763db92bc0
+Create Date: 2026-10-19 20:31:07.118642
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '405c77a3cdd6'
+down_revision: Union[str, None] = '09763db92bc0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('resume_sections', sa.Column('last_stored_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+    op.create_index(op.f('ix_resume_sections_last_stored_at'), 'resume_sections', ['last_stored_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_resume_sections_last_stored_at'), table_name='resume_sections')
+    op.drop_column('resume_sections', 'last_stored_at')
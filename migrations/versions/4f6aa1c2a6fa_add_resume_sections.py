@@ -0,0 +1,143 @@
+"""add_resume_sections
+
+Revision ID: 4f6aa1c2a6fa
+Revises: d313b06ac65e
+Create Date: 2026-10-19 10:12:31.482113
+
+"""
+import hashlib
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '4f6aa1c2a6fa'
+down_revision: Union[str, None] = 'd313b06ac65e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of the section layout in database/repositories/section.py
+SECTION_FIELDS = ("header",)
+LIST_SECTION_FIELDS = ("work_experience", "education", "additional_sections")
+REF_KEY = "$ref"
+BATCH_SIZE = 500
+
+resume = sa.table(
+    'resume',
+    sa.column('id', sa.Integer()),
+    sa.column('resume_data', postgresql.JSONB()),
+)
+resume_sections = sa.table(
+    'resume_sections',
+    sa.column('hash', sa.String()),
+    sa.column('content', postgresql.JSONB()),
+)
+
+
+def _is_ref(value):
+    return isinstance(value, dict) and len(value) == 1 and REF_KEY in value
+
+
+def _split(resume_data, sections):
+    def ref(content):
+        if _is_ref(content):
+            return content
+        canonical = json.dumps(content, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        sections[digest] = content
+        return {REF_KEY: digest}
+
+    refs = dict(resume_data)
+    for field in SECTION_FIELDS:
+        if field in refs:
+            refs[field] = ref(refs[field])
+    for field in LIST_SECTION_FIELDS:
+        if field in refs:
+            refs[field] = [ref(item) for item in refs[field]]
+    return refs
+
+
+def _assemble(resume_data, sections):
+    def resolve(value):
+        return sections[value[REF_KEY]] if _is_ref(value) else value
+
+    assembled = dict(resume_data)
+    for field in SECTION_FIELDS:
+        if field in assembled:
+            assembled[field] = resolve(assembled[field])
+    for field in LIST_SECTION_FIELDS:
+        if field in assembled:
+            assembled[field] = [resolve(item) for item in assembled[field]]
+    return assembled
+
+
+def _iter_batches(connection):
+    """Walk the resume table in id order, BATCH_SIZE rows at a time."""
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(resume.c.id, resume.c.resume_data)
+            .where(resume.c.id > last_id)
+            .order_by(resume.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('resume_sections',
+    sa.Column('hash', sa.String(length=64), nullable=False),
+    sa.Column('content', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('hash')
+    )
+
+    # Backfill: move the sections of existing resumes into the store
+    connection = op.get_bind()
+    for rows in _iter_batches(connection):
+        sections = {}
+        updates = [
+            {"row_id": row.id, "data": _split(row.resume_data, sections)}
+            for row in rows
+        ]
+        if sections:
+            connection.execute(
+                postgresql.insert(resume_sections)
+                .values([{"hash": digest, "content": content} for digest, content in sections.items()])
+                .on_conflict_do_nothing(index_elements=["hash"])
+            )
+        connection.execute(
+            resume.update().where(resume.c.id == sa.bindparam("row_id")).values(resume_data=sa.bindparam("data")),
+            updates,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Inline the sections again before dropping the store
+    connection = op.get_bind()
+    for rows in _iter_batches(connection):
+        hashes = set()
+        for row in rows:
+            for field in SECTION_FIELDS:
+                if _is_ref(row.resume_data.get(field)):
+                    hashes.add(row.resume_data[field][REF_KEY])
+            for field in LIST_SECTION_FIELDS:
+                hashes.update(item[REF_KEY] for item in row.resume_data.get(field) or [] if _is_ref(item))
+        sections = dict(connection.execute(
+            sa.select(resume_sections.c.hash, resume_sections.c.content)
+            .where(resume_sections.c.hash.in_(hashes))
+        ).all())
+        connection.execute(
+            resume.update().where(resume.c.id == sa.bindparam("row_id")).values(resume_data=sa.bindparam("data")),
+            [{"row_id": row.id, "data": _assemble(row.resume_data, sections)} for row in rows],
+        )
+
+    op.drop_table('resume_sections')
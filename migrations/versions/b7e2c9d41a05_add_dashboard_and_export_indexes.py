@@ -0,0 +1,32 @@
+"""add_dashboard_and_export_indexes
+
+Revision ID: b7e2c9d41a05
+Revises: 1500623ef457
+Create Date: 2026-10-19 21:15:08.412337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2c9d41a05'
+down_revision: Union[str, None] = '1500623ef457'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_user_profile_user_id'), 'user_profile', ['user_id'], unique=False)
+    op.create_index(op.f('ix_resume_profile_id'), 'resume', ['profile_id'], unique=False)
+    op.create_index('ix_resume_user_id_id', 'resume', ['user_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_resume_user_id_id', table_name='resume')
+    op.drop_index(op.f('ix_resume_profile_id'), table_name='resume')
+    op.drop_index(op.f('ix_user_profile_user_id'), table_name='user_profile')
@@ -0,0 +1,115 @@
+import json
+import re
+import zipfile
+from typing import Dict, Any, Iterable, Iterator, List
+
+import fastJson
+
+
+EXPORT_FORMATS = ("ndjson", "zip")
+
+
+class _StreamBuffer:
+    """Write-only, unseekable buffer that hands its contents over on drain()."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _row_to_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert an exported resume row into a JSON-serializable dictionary."""
+    record = dict(row)
+    for key in ("created_at", "updated_at"):
+        if record.get(key) is not None:
+            record[key] = record[key].isoformat()
+    return record
+
+
+def _slugify(value: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-") or "resume"
+
+
+def render_resume_markdown(resume_data: Dict[str, Any]) -> str:
+    """Render stored resume data (the Resume schema) as a Markdown document."""
+    lines = []
+
+    header = resume_data.get("header", {})
+    lines.append(f"# {header.get('name') or header.get('Name') or 'Resume'}")
+    contact = [v for k, v in header.items() if k.lower() != "name" and v]
+    if contact:
+        lines.append(" | ".join(contact))
+
+    if resume_data.get("summary"):
+        lines += ["", "## Summary", resume_data["summary"]]
+
+    def add_sections(title: str, sections: List[Dict[str, Any]]):
+        if not sections:
+            return
+        lines.extend(["", f"## {title}"])
+        for section in sections:
+            lines.extend(["", f"### {section.get('title', '')}"])
+            lines.extend(f"- {item}" for item in section.get("content", []))
+
+    add_sections("Work Experience", resume_data.get("work_experience", []))
+
+    if resume_data.get("skills"):
+        lines += ["", "## Skills", ", ".join(resume_data["skills"])]
+
+    add_sections("Education", resume_data.get("education", []))
+
+    for section in resume_data.get("additional_sections", []):
+        lines.extend(["", f"## {section.get('title', '')}"])
+        lines.extend(f"- {item}" for item in section.get("content", []))
+
+    return "\n".join(lines) + "\n"
+
+
+def stream_ndjson(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """Yield one JSON document per resume, newline-delimited."""
+    for row in rows:
+        yield fastJson.dumps(row) + b"\n"
+
+
+def stream_zip(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """
+    Yield a ZIP archive holding a JSON and a Markdown file per resume.
+
+    The archive is written to an unseekable buffer, so zipfile uses data
+    descriptors and each chunk can be sent as soon as its entry is written.
+    """
+    buffer = _StreamBuffer()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for row in rows:
+            record = _row_to_dict(row)
+            base_name = f"{record['id']}-{_slugify(record['name'])}"
+
+            archive.writestr(f"{base_name}.json", json.dumps(record, indent=2))
+            archive.writestr(f"{base_name}.md", render_resume_markdown(record["resume_data"]))
+
+            chunk = buffer.drain()
+            if chunk:
+                yield chunk
+
+    # Central directory
+    yield buffer.drain()
+
+
+def stream_export(rows: Iterable[Dict[str, Any]], export_format: str) -> Iterator[bytes]:
+    """Stream exported resumes in the requested format ("ndjson" or "zip")."""
+    if export_format == "ndjson":
+        return stream_ndjson(rows)
+    if export_format == "zip":
+        return stream_zip(rows)
+    raise ValueError(f"Unsupported export format: {export_format}")
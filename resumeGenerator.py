@@ -1,14 +1,16 @@
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 
 from langchain_openai import ChatOpenAI
 from langchain.chat_models import init_chat_model
 from langchain.prompts import ChatPromptTemplate
 from langchain.output_parsers import PydanticOutputParser
-from pydantic import BaseModel, Field
+from langchain_core.exceptions import OutputParserException
+from pydantic import BaseModel, Field, ValidationError
 
 from init_llm import get_llm
 from Schema.resume_Schema import Resume
+from atsScorer import ATSScorer, extract_keywords, parse_requirements
 
 
 # Configure logging
@@ -18,6 +20,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Sampling temperature for n-best candidates, higher than the default so they differ
+NBEST_TEMPERATURE = 0.7
+# Job description keywords listed in the prompt
+PROMPT_KEYWORDS = 20
+
 
 # Create a resume generator class
 class ResumeGenerator:
@@ -26,12 +33,36 @@ class ResumeGenerator:
     def __init__(self):
         self.llm = get_llm()
         self.output_parser = PydanticOutputParser(pydantic_object=Resume)
+
+        # Build the prompt and chain once per generator; only the user/job
+        # variables change between calls.
+        self.prompt = self._create_resume_prompt()
+        self.chain = self.prompt | self.llm
     
     def _create_resume_prompt(self):
-        """Create the prompt template for resume generation."""
-        template = """
+        """
+        Create the prompt template for resume generation.
+
+        The static instructions and the Resume schema go first so that every
+        request shares the same prompt prefix and the provider can serve it
+        from its prefix cache. The per-request user and job details go last.
+        """
+        system_template = """
         You are an expert resume writer with years of experience creating tailored, ATS-friendly resumes.
         
+        You will be given a USER PROFILE, the JOB DETAILS, the JOB DESCRIPTION and the KEY REQUIREMENTS
+        and KEYWORDS taken from it.
+        Create a tailored, professional resume that highlights the most relevant skills and experiences 
+        for this specific job. Focus on quantifiable achievements and use strong action verbs.
+        Address the key requirements the user's profile supports, and make sure the resume is ATS-friendly
+        by using the keywords wherever they truthfully apply.
+        
+        Limit the resume to one page worth of content and prioritize the most relevant information.
+        
+        {format_instructions}
+        """
+
+        human_template = """
         # USER PROFILE
         {user_profile}
         
@@ -42,23 +73,27 @@ class ResumeGenerator:
         # JOB DESCRIPTION
         {job_description}
         
-        Create a tailored, professional resume that highlights the most relevant skills and experiences 
-        for this specific job. Focus on quantifiable achievements and use strong action verbs.
-        Make sure the resume is ATS-friendly and optimized with relevant keywords from the job description.
+        # KEY REQUIREMENTS
+        {requirements}
         
-        Limit the resume to one page worth of content and prioritize the most relevant information.
-        
-        {format_instructions}
+        # KEYWORDS
+        {keywords}
         """
         
-        return ChatPromptTemplate.from_template(template)
+        prompt = ChatPromptTemplate.from_messages([
+            ("system", system_template),
+            ("human", human_template),
+        ])
+        return prompt.partial(format_instructions=self.output_parser.get_format_instructions())
     
     def generate_resume(
         self, 
         user_profile: Dict[str, Any], 
         company_name: str, 
         job_role: str, 
-        job_description: str
+        job_description: str,
+        requirements: Optional[List[str]] = None,
+        job_keywords: Optional[Dict[str, float]] = None,
     ) -> Resume:
         """
         Generate a tailored resume.
@@ -68,24 +103,147 @@ class ResumeGenerator:
             company_name: Name of the company being applied to
             job_role: The role being applied for
             job_description: Full job description
+            requirements: Precomputed requirements of the job description
+            job_keywords: Precomputed keywords of the job description
             
         Returns:
             Resume object with tailored content
         """
-        prompt = self._create_resume_prompt()
-        chain = prompt | self.llm | self.output_parser
-        
-        # Format user profile for the prompt
-        user_profile_text = self._format_user_profile(user_profile)
-        
-        result = chain.invoke({
-            "user_profile": user_profile_text,
+        message = self.chain.invoke(
+            self._prompt_inputs(
+                user_profile, company_name, job_role, job_description, requirements, job_keywords
+            )
+        )
+        self._log_usage(message)
+
+        return self._parse(message)
+
+    def generate_best_resume(
+        self,
+        user_profile: Dict[str, Any],
+        company_name: str,
+        job_role: str,
+        job_description: str,
+        candidates: int = 1,
+        requirements: Optional[List[str]] = None,
+        job_keywords: Optional[Dict[str, float]] = None,
+    ) -> Tuple[Resume, Dict[str, Any]]:
+        """
+        Generate one or more candidate resumes and return the best one.
+
+        All candidates come from a single request (the `n` parameter), so the
+        prompt is only sent and billed once; each extra candidate costs only
+        its completion tokens. They are scored locally with ATSScorer, so
+        picking the best costs no extra LLM call. Pass the precomputed
+        `requirements` and `job_keywords` of a shared job posting to skip
+        extracting them again; the keywords both go into the prompt and
+        drive the scoring.
+
+        Returns:
+            The best Resume and its ATS score
+        """
+        if job_keywords is None:
+            job_keywords = extract_keywords(job_description)
+        inputs = self._prompt_inputs(
+            user_profile, company_name, job_role, job_description, requirements, job_keywords
+        )
+        if candidates > 1:
+            result = self.llm.generate(
+                [self.prompt.format_messages(**inputs)],
+                n=candidates,
+                temperature=NBEST_TEMPERATURE,
+            )
+            messages = [generation.message for generation in result.generations[0]]
+        else:
+            messages = [self.chain.invoke(inputs)]
+        # Every choice carries the usage of the whole request
+        self._log_usage(messages[0])
+
+        resumes: List[Resume] = []
+        for message in messages:
+            try:
+                resumes.append(self._parse(message))
+            except OutputParserException as e:
+                logger.warning("Discarding resume candidate that failed to parse: %s", e)
+        if not resumes:
+            raise ValueError("None of the resume candidates could be parsed")
+
+        scores = ATSScorer(job_description, keywords=job_keywords).score_batch(resumes)
+        best = max(range(len(resumes)), key=lambda i: scores[i]["overall"])
+        logger.info(
+            "Selected candidate %d of %d with ATS score %s",
+            best + 1, len(resumes), scores[best]["overall"],
+        )
+        return resumes[best], scores[best]
+
+    def _parse(self, message) -> Resume:
+        """
+        Validate the model output into a Resume straight from its JSON text.
+
+        Skips the intermediate dict built by the output parser, which is only
+        used as a fallback when the text is not a bare (or fenced) JSON object.
+        """
+        text = message.content.strip()
+        if text.startswith("```"):
+            text = text.split("\n", 1)[-1].rsplit("```", 1)[0]
+        try:
+            return Resume.model_validate_json(text)
+        except ValidationError:
+            return self.output_parser.invoke(message)
+
+    def _prompt_inputs(
+        self,
+        user_profile: Dict[str, Any],
+        company_name: str,
+        job_role: str,
+        job_description: str,
+        requirements: Optional[List[str]] = None,
+        job_keywords: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, str]:
+        """Build the variable part of the prompt, analysing the job description if not done already."""
+        if requirements is None:
+            requirements = parse_requirements(job_description)
+        if job_keywords is None:
+            job_keywords = extract_keywords(job_description)
+        # Keywords are weighted most frequent first
+        keywords = sorted(job_keywords, key=job_keywords.get, reverse=True)[:PROMPT_KEYWORDS]
+        return {
+            # Format user profile for the prompt
+            "user_profile": self._format_user_profile(user_profile),
             "company_name": company_name,
             "job_role": job_role,
             "job_description": job_description,
-            "format_instructions": self.output_parser.get_format_instructions()
-        })
-        return result
+            "requirements": "\n".join(f"- {item}" for item in requirements) or "None listed",
+            "keywords": ", ".join(keywords) or "None listed",
+        }
+
+    def _log_usage(self, message) -> Dict[str, int]:
+        """Log the token usage of an LLM response, including cached prompt tokens."""
+        usage = self._extract_usage(message)
+        logger.info(
+            "Resume generated: %s prompt tokens (%s cached), %s completion tokens",
+            usage["prompt_tokens"],
+            usage["cached_prompt_tokens"],
+            usage["completion_tokens"],
+        )
+        return usage
+
+    def _extract_usage(self, message) -> Dict[str, int]:
+        """Read prompt, cached-prompt and completion token counts from the LLM response."""
+        usage = getattr(message, "usage_metadata", None) or {}
+        input_details = usage.get("input_token_details") or {}
+        cached = input_details.get("cache_read")
+
+        # Fall back to the raw OpenAI token usage block
+        token_usage = (getattr(message, "response_metadata", None) or {}).get("token_usage") or {}
+        if cached is None:
+            cached = (token_usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0)
+
+        return {
+            "prompt_tokens": usage.get("input_tokens", token_usage.get("prompt_tokens", 0)),
+            "cached_prompt_tokens": cached or 0,
+            "completion_tokens": usage.get("output_tokens", token_usage.get("completion_tokens", 0)),
+        }
     
     def _format_user_profile(self, user_profile: Dict[str, Any]) -> str:
         """Format user profile data for inclusion in the prompt."""
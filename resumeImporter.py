@@ -0,0 +1,394 @@
+import logging
+import multiprocessing
+import os
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+from xml.etree import ElementTree
+
+from langchain.prompts import ChatPromptTemplate
+from langchain.output_parsers import PydanticOutputParser
+from pypdf import PdfReader
+from pypdf.errors import PyPdfError
+
+from init_llm import get_llm
+from Schema.profile_Schema import ParsedFragments
+
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+# Pages handed to one worker process at a time
+PAGES_PER_TASK = 4
+# Ambiguous fragments sent to the LLM per call
+FRAGMENTS_PER_CALL = 8
+
+SECTION_HEADINGS = {
+    "summary": r"(professional\s+)?(summary|profile)|objective|about\s+me",
+    "work_experience": r"((work|professional|relevant)\s+)?(experience|employment(\s+history)?|work\s+history)",
+    "education": r"education(\s+(and|&)\s+training)?|academic\s+background",
+    "skills": r"((technical|core|key)\s+)?(skills|competencies)(\s+(and|&)\s+\w+)?|technologies",
+    "certifications": r"certifications?|certificates|licen[cs]es(\s+(and|&)\s+certifications)?",
+    "projects": r"((personal|selected|key|academic)\s+)?projects",
+}
+HEADING_PATTERNS = {
+    section: re.compile(rf"^\s*({pattern})\s*:?\s*$", re.IGNORECASE)
+    for section, pattern in SECTION_HEADINGS.items()
+}
+
+BULLET = re.compile(r"^\s*[-•●▪◦*·–]\s*")
+EMAIL = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+PHONE = re.compile(r"\+?\(?\d[\d\s().-]{7,}\d")
+LINKEDIN = re.compile(r"(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+/?", re.IGNORECASE)
+LOCATION = re.compile(r"^([A-Z][\w .'-]+,\s*[A-Z][\w .'-]+|Remote)$")
+MONTH = r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\.?"
+DATE = rf"(?:{MONTH}\s+)?(?:\d{{1,2}}/)?\d{{4}}"
+DATE_RANGE = re.compile(rf"{DATE}\s*(?:-|–|—|to)\s*(?:{DATE}|Present|Current|Now)", re.IGNORECASE)
+YEAR = re.compile(r"\b(19|20)\d{2}\b")
+GPA = re.compile(r"GPA[:\s]*([\d.]+\s*(?:/\s*[\d.]+)?)", re.IGNORECASE)
+DEGREE = re.compile(
+    r"\b(Bachelor'?s?|Master'?s?|Ph\.?D\.?|Doctorate|Associate'?s?|Diploma|MBA|"
+    r"B\.?\s?(?:S|A|E|Sc|Tech)\.?|M\.?\s?(?:S|A|Sc|Tech|Eng)\.?)(?=\W|$)"
+    r"(?:\s+of\s+(?:Science|Arts|Engineering|Technology|Business\s+Administration))?"
+)
+FIELD = re.compile(r"\b(?:in|of)\s+([A-Z][A-Za-z &]+)")
+INSTITUTION = re.compile(r"\b(University|College|Institute|School|Academy|Polytechnic)\b|\bMIT\b")
+ROLE = re.compile(
+    r"\b(Engineer|Developer|Manager|Analyst|Intern|Designer|Consultant|Lead|Director|"
+    r"Scientist|Specialist|Architect|Officer|Assistant|Administrator|Programmer|Head|VP|President)\b",
+    re.IGNORECASE,
+)
+TECHNOLOGIES = re.compile(r"^(?:Technologies|Tech\s+Stack|Built\s+with|Tools)\s*:\s*(.+)$", re.IGNORECASE)
+SEPARATORS = re.compile(r"\s+(?:\||–|—|-)\s+|\s*\|\s*|,\s+(?=[A-Z])")
+# Institution names often contain commas ("University of California, Berkeley")
+SCHOOL_SEPARATORS = re.compile(r"\s+(?:\||–|—|-)\s+|\s*\|\s*")
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+class UnreadableFileError(ValueError):
+    """The upload claims to be a PDF or DOCX file but cannot be read as one."""
+
+
+def start_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Create the process pool used for PDF extraction.
+
+    The API creates it at startup and shuts it down with shutdown_pool().
+    Workers come from a forkserver (spawn where that is unavailable), never
+    from forking the threaded server process itself.
+    """
+    global _pool
+    if _pool is None:
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+            context.set_forkserver_preload([__name__])
+        else:
+            context = multiprocessing.get_context("spawn")
+        _pool = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(), mp_context=context)
+    return _pool
+
+
+def shutdown_pool():
+    """Stop the worker processes of the PDF extraction pool."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """The extraction pool, created on first use outside the API (scripts, notebooks)."""
+    return _pool or start_pool()
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> List[str]:
+    """Extract the text of pages [start, stop). Runs in a worker process."""
+    reader = PdfReader(path)
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def extract_pdf_text(path: str) -> str:
+    """Extract the text of a PDF, spreading its pages across the process pool."""
+    page_count = len(PdfReader(path).pages)
+    if page_count <= PAGES_PER_TASK:
+        return "\n".join(_extract_page_range(path, 0, page_count))
+
+    ranges = [(start, min(start + PAGES_PER_TASK, page_count)) for start in range(0, page_count, PAGES_PER_TASK)]
+    pool = _get_pool()
+    futures = [pool.submit(_extract_page_range, path, start, stop) for start, stop in ranges]
+    return "\n".join(text for future in futures for text in future.result())
+
+
+def extract_docx_text(path: str) -> str:
+    """Extract paragraph text from a DOCX file without loading the whole document tree."""
+    namespace = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+    paragraphs = []
+    with zipfile.ZipFile(path) as archive:
+        if "word/document.xml" not in archive.namelist():
+            raise ValueError("Unsupported file type, the ZIP archive is not a DOCX document")
+        with archive.open("word/document.xml") as document:
+            for _, element in ElementTree.iterparse(document):
+                if element.tag == f"{namespace}p":
+                    paragraphs.append("".join(node.text or "" for node in element.iter(f"{namespace}t")))
+                    element.clear()
+    return "\n".join(paragraphs)
+
+
+def extract_text(path: str) -> str:
+    """
+    Extract text from a PDF or DOCX file, detected by its leading bytes.
+
+    Raises ValueError for other file types and UnreadableFileError for a
+    PDF or DOCX file that is corrupt.
+    """
+    with open(path, "rb") as f:
+        magic = f.read(4)
+    try:
+        if magic.startswith(b"%PDF"):
+            return extract_pdf_text(path)
+        if magic.startswith(b"PK"):
+            return extract_docx_text(path)
+    except (PyPdfError, zipfile.BadZipFile, ElementTree.ParseError) as e:
+        raise UnreadableFileError(f"The file could not be read: {e}") from e
+    raise ValueError("Unsupported file type, expected a PDF or DOCX resume")
+
+
+def segment_text(text: str) -> Dict[str, List[str]]:
+    """Split resume text into sections by their headings. Text before the first heading is the header."""
+    sections: Dict[str, List[str]] = {"header": []}
+    current = "header"
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        heading = next(
+            (section for section, pattern in HEADING_PATTERNS.items() if len(line) < 50 and pattern.match(line)),
+            None,
+        )
+        if heading:
+            current = heading
+            sections.setdefault(current, [])
+        else:
+            sections[current].append(line)
+    return sections
+
+
+def _split_entries(lines: List[str]) -> List[List[str]]:
+    """Group section lines into entries: a plain line after a bullet or detail line starts a new entry."""
+    entries: List[List[str]] = []
+    previous_was_bullet = True
+    for line in lines:
+        is_bullet = bool(BULLET.match(line) or TECHNOLOGIES.match(line))
+        if not is_bullet and (previous_was_bullet or not entries):
+            entries.append([])
+        entries[-1].append(line)
+        previous_was_bullet = is_bullet
+    return entries
+
+
+def parse_personal_info(lines: List[str], text: str) -> Dict[str, str]:
+    email = EMAIL.search(text)
+    phone = PHONE.search("\n".join(lines))
+    linkedin = LINKEDIN.search(text)
+    location = next((part.strip() for line in lines for part in re.split(r"\s*[|•·]\s*", line)
+                     if LOCATION.match(part.strip()) and not EMAIL.search(part)), "")
+    return {
+        "name": lines[0] if lines else "",
+        "email": email.group(0) if email else "",
+        "phone": phone.group(0).strip() if phone else "",
+        "location": location,
+        "linkedin": linkedin.group(0) if linkedin else "",
+    }
+
+
+def _parse_job(entry: List[str]) -> Optional[Dict[str, Any]]:
+    """Parse one work experience entry, or return None when company and role are unclear."""
+    header = [line for line in entry if not BULLET.match(line)]
+    achievements = [BULLET.sub("", line) for line in entry if BULLET.match(line)]
+
+    duration, location, parts = "", "", []
+    for line in header:
+        match = DATE_RANGE.search(line)
+        if match:
+            duration = duration or match.group(0)
+            line = (line[:match.start()] + line[match.end():]).strip(" ,|–—-()")
+        for part in SEPARATORS.split(line):
+            part = part.strip()
+            if not part:
+                continue
+            if LOCATION.match(part) and not ROLE.search(part):
+                location = location or part
+            else:
+                parts.append(part)
+
+    company = role = None
+    if len(parts) == 1 and " at " in parts[0]:
+        role, company = parts[0].split(" at ", 1)
+    elif len(parts) == 2:
+        role_parts = [part for part in parts if ROLE.search(part)]
+        if len(role_parts) == 1:
+            role = role_parts[0]
+            company = parts[1] if parts[0] == role else parts[0]
+
+    if not company or not role:
+        return None
+    return {
+        "company": company.strip(),
+        "role": role.strip(),
+        "duration": duration,
+        "location": location,
+        "achievements": achievements,
+    }
+
+
+def _parse_school(entry: List[str]) -> Optional[Dict[str, str]]:
+    """Parse one education entry, or return None when institution or degree are unclear."""
+    text = " ".join(BULLET.sub("", line) for line in entry)
+    institution = next((part.strip() for line in entry for part in SCHOOL_SEPARATORS.split(line)
+                        if INSTITUTION.search(part)), None)
+    degree = DEGREE.search(text)
+    if not institution or not degree:
+        return None
+
+    field = FIELD.search(text[degree.end():])
+    years = [match.group(0) for match in YEAR.finditer(text)]
+    gpa = GPA.search(text)
+    return {
+        "institution": institution,
+        "degree": degree.group(0),
+        "field": field.group(1).strip() if field else "",
+        "graduation_date": years[-1] if years else "",
+        "gpa": gpa.group(1) if gpa else "",
+    }
+
+
+def _split_schools(lines: List[str]) -> List[List[str]]:
+    """Group education lines into entries, one per institution."""
+    entries: List[List[str]] = []
+    for line in lines:
+        if INSTITUTION.search(line) and (not entries or any(INSTITUTION.search(l) for l in entries[-1])):
+            entries.append([])
+        if not entries:
+            entries.append([])
+        entries[-1].append(line)
+    return entries
+
+
+def _parse_project(entry: List[str]) -> Dict[str, Any]:
+    name = BULLET.sub("", entry[0])
+    technologies: List[str] = []
+    description = []
+    for line in entry[1:]:
+        line = BULLET.sub("", line)
+        match = TECHNOLOGIES.match(line)
+        if match:
+            technologies = [tech.strip() for tech in re.split(r"[,;|]", match.group(1)) if tech.strip()]
+        else:
+            description.append(line)
+    return {"name": name, "description": " ".join(description), "technologies": technologies}
+
+
+def _split_items(lines: List[str]) -> List[str]:
+    items = []
+    for line in lines:
+        line = BULLET.sub("", line)
+        # "Languages: Python, Go" -> "Python, Go"
+        if ":" in line and len(line.split(":", 1)[0]) < 30:
+            line = line.split(":", 1)[1]
+        items.extend(item.strip() for item in re.split(r"[,;|•·]", line) if item.strip())
+    return list(dict.fromkeys(items))
+
+
+class ResumeImporter:
+    """Build a user profile from an uploaded PDF or DOCX resume."""
+
+    def __init__(self):
+        self.output_parser = PydanticOutputParser(pydantic_object=ParsedFragments)
+        self._chain = None
+
+    def _get_chain(self):
+        """The LLM is only needed for ambiguous fragments, so the chain is built lazily."""
+        if self._chain is None:
+            prompt = ChatPromptTemplate.from_messages([
+                ("system", """
+        You extract structured data from fragments of a resume that a rule-based parser could not read.
+        Each fragment has an id and the resume section it was found in. For each fragment return one
+        entry with the same id, filling work_experience or education as appropriate. Only use
+        information present in the fragment.
+
+        {format_instructions}
+        """),
+                ("human", "{fragments}"),
+            ]).partial(format_instructions=self.output_parser.get_format_instructions())
+            self._chain = prompt | get_llm() | self.output_parser
+        return self._chain
+
+    def _resolve_fragments(self, fragments: List[Tuple[str, List[str]]]) -> Tuple[List[dict], List[dict]]:
+        """Parse ambiguous fragments with the LLM in small batches sent concurrently."""
+        inputs = []
+        for start in range(0, len(fragments), FRAGMENTS_PER_CALL):
+            batch = fragments[start:start + FRAGMENTS_PER_CALL]
+            inputs.append({"fragments": "\n\n".join(
+                f"## Fragment {start + i} ({section})\n" + "\n".join(lines)
+                for i, (section, lines) in enumerate(batch)
+            )})
+
+        jobs, schools = [], []
+        for result in self._get_chain().batch(inputs, config={"max_concurrency": 4}):
+            for fragment in result.fragments:
+                if fragment.work_experience:
+                    jobs.append(fragment.work_experience.model_dump())
+                if fragment.education:
+                    schools.append(fragment.education.model_dump())
+        return jobs, schools
+
+    def parse_text(self, text: str) -> Dict[str, Any]:
+        """
+        Turn resume text into the UserProfile documents.
+
+        Returns a dictionary with personal_info, work_experience, education,
+        skills, certifications and projects, plus the number of fragments
+        that had to be resolved by the LLM.
+        """
+        sections = segment_text(text)
+
+        work_experience, education, ambiguous = [], [], []
+        for entry in _split_entries(sections.get("work_experience", [])):
+            job = _parse_job(entry)
+            if job:
+                work_experience.append(job)
+            else:
+                ambiguous.append(("work_experience", entry))
+        for entry in _split_schools(sections.get("education", [])):
+            school = _parse_school(entry)
+            if school:
+                education.append(school)
+            else:
+                ambiguous.append(("education", entry))
+
+        if ambiguous:
+            logger.info("Sending %d ambiguous resume fragments to the LLM", len(ambiguous))
+            jobs, schools = self._resolve_fragments(ambiguous)
+            work_experience.extend(jobs)
+            education.extend(schools)
+
+        return {
+            "personal_info": parse_personal_info(sections["header"], text),
+            "work_experience": work_experience,
+            "education": education,
+            "skills": _split_items(sections.get("skills", [])),
+            "certifications": [BULLET.sub("", line) for line in sections.get("certifications", [])],
+            "projects": [_parse_project(entry) for entry in _split_entries(sections.get("projects", []))],
+            "llm_fragments": len(ambiguous),
+        }
+
+    def import_file(self, path: str) -> Dict[str, Any]:
+        """Extract and parse a PDF or DOCX resume stored at `path`."""
+        return self.parse_text(extract_text(path))
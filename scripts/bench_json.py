@@ -0,0 +1,68 @@
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from fastapi.encoders import jsonable_encoder
+from langchain.output_parsers import PydanticOutputParser
+from langchain_core.messages import AIMessage
+
+import fastJson
+from Schema.resume_Schema import Resume
+
+def sample_resume_json(jobs=8, bullets=8) -> str:
+    """A large resume as the LLM would return it."""
+    section = lambda title: {
+        "title": title,
+        "content": [f"Delivered measurable outcome number {i} using Python, AWS and Kubernetes at scale" for i in range(bullets)],
+    }
+    return json.dumps({
+        "header": {"name": "Alex Johnson", "email": "alex@example.com", "phone": "123-456-7890", "linkedin": "linkedin.com/in/alex"},
+        "summary": "Senior engineer with a decade of experience building distributed systems. " * 4,
+        "work_experience": [section(f"Senior Engineer, Company {i}") for i in range(jobs)],
+        "skills": ["Python", "JavaScript", "AWS", "Docker", "Kubernetes", "SQL", "CI/CD", "Terraform"] * 3,
+        "education": [section("MIT, M.S. Computer Science"), section("UC Berkeley, B.S. Computer Science")],
+        "additional_sections": [section("Certifications"), section("Projects")],
+    })
+
+def before(text: str, parser: PydanticOutputParser):
+    """Output parser -> Resume -> jsonable_encoder -> json response + json JSONB."""
+    resume = parser.invoke(AIMessage(content=text))
+    payload = jsonable_encoder(resume.model_dump())
+    json.dumps(payload).encode("utf-8")  # JSONB bind
+    return json.dumps(payload).encode("utf-8")  # response
+
+def after(text: str, parser: PydanticOutputParser):
+    """Resume.model_validate_json -> model_dump -> fastJson for JSONB and response."""
+    resume = Resume.model_validate_json(text)
+    payload = resume.model_dump()
+    fastJson.dumps_str(payload)  # JSONB bind
+    return fastJson.dumps(payload)  # response
+
+def measure(fn, text, parser, iterations):
+    start = time.process_time()
+    for _ in range(iterations):
+        fn(text, parser)
+    return (time.process_time() - start) / iterations * 1e6
+
+def main():
+    """Compare CPU time per request of the old and the fast JSON path."""
+    arg_parser = argparse.ArgumentParser(description="Benchmark resume JSON handling.")
+    arg_parser.add_argument("--iterations", type=int, default=2000)
+    args = arg_parser.parse_args()
+
+    text = sample_resume_json()
+    parser = PydanticOutputParser(pydantic_object=Resume)
+    print(f"Resume size: {len(text)} bytes, orjson: {fastJson.HAS_ORJSON}")
+
+    for name, fn in (("before", before), ("after", after)):
+        fn(text, parser)  # warm up
+        print(f"{name:>6}: {measure(fn, text, parser, args.iterations):8.1f} us CPU per request")
+
+if __name__ == "__main__":
+    main()
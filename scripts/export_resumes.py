@@ -0,0 +1,47 @@
+import argparse
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from database.database import engine
+from database.repositories.resume import iter_resumes_for_export
+from resumeExporter import EXPORT_FORMATS, stream_export
+
+# Load environment variables
+load_dotenv()
+
+def export_resumes(output, user_id=None, export_format="ndjson", batch_size=500):
+    """Stream resumes from the database into a binary file object."""
+    written = 0
+    with Session(engine) as session:
+        rows = iter_resumes_for_export(session, user_id=user_id, batch_size=batch_size)
+        for chunk in stream_export(rows, export_format):
+            output.write(chunk)
+            written += len(chunk)
+    return written
+
+def main():
+    """Export resumes for one user, or for every user when no user is given."""
+    parser = argparse.ArgumentParser(description="Export stored resumes as NDJSON or a ZIP archive.")
+    parser.add_argument("--user-id", type=int, default=None, help="Only export this user's resumes")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson", help="Export format")
+    parser.add_argument("--output", default="-", help="Output file (default: stdout)")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows fetched per round-trip")
+    args = parser.parse_args()
+
+    if args.output == "-":
+        written = export_resumes(sys.stdout.buffer, args.user_id, args.format, args.batch_size)
+    else:
+        with open(args.output, "wb") as output:
+            written = export_resumes(output, args.user_id, args.format, args.batch_size)
+
+    print(f"Exported {written} bytes", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
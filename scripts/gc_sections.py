@@ -0,0 +1,35 @@
+import argparse
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from database.database import engine
+from database.repositories.section import GC_GRACE_PERIOD, delete_unreferenced_sections
+
+# Load environment variables
+load_dotenv()
+
+def main():
+    """Delete resume sections that no resume references any more. Run periodically, e.g. from cron."""
+    parser = argparse.ArgumentParser(description="Garbage-collect unreferenced resume sections.")
+    parser.add_argument(
+        "--grace-minutes", type=float, default=GC_GRACE_PERIOD.total_seconds() / 60,
+        help="Keep sections stored more recently than this",
+    )
+    args = parser.parse_args()
+
+    with Session(engine) as session:
+        deleted = delete_unreferenced_sections(session, timedelta(minutes=args.grace_minutes))
+        session.commit()
+
+    print(f"Deleted {deleted} unreferenced sections")
+
+if __name__ == "__main__":
+    main()
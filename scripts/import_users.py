@@ -0,0 +1,34 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from dotenv import load_dotenv
+
+from userImporter import CHUNK_SIZE, import_users, iter_records
+
+# Load environment variables
+load_dotenv()
+
+def main():
+    """Bulk import users and profiles from a CSV or NDJSON file."""
+    parser = argparse.ArgumentParser(description="Bulk import users (and profiles) with COPY.")
+    parser.add_argument("path", help="CSV with name,email,password columns or NDJSON with optional profile objects")
+    parser.add_argument("--workers", type=int, default=None, help="Password hashing processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Rows per COPY")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = import_users(iter_records(args.path), workers=args.workers, chunk_size=args.chunk_size)
+    elapsed = time.perf_counter() - start
+
+    print(f"Read {stats['read']} rows in {elapsed:.1f}s")
+    print(f"Created {stats['users']} users and {stats['profiles']} profiles")
+    print(f"Skipped {stats['duplicates']} duplicate emails and {stats['invalid']} invalid rows")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from database.database import engine
+from database.repositories.section import get_dedup_stats
+
+# Load environment variables
+load_dotenv()
+
+def main():
+    """Print how well the resume section store deduplicates."""
+    with Session(engine) as session:
+        stats = get_dedup_stats(session)
+
+    print(f"Section references: {stats['section_refs']}")
+    print(f"Unique sections:    {stats['unique_sections']}")
+    print(f"Logical size:       {stats['logical_bytes']} bytes")
+    print(f"Stored size:        {stats['stored_bytes']} bytes")
+    print(f"Dedup ratio:        {stats['dedup_ratio']}x")
+
+if __name__ == "__main__":
+    main()
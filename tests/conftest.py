@@ -0,0 +1,56 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+# The engine is created on import; it never connects unless a test uses it
+os.environ.setdefault("POSTGRES_URI", "postgresql+psycopg://test@localhost/test")
+
+from database.database import Base
+import database  # noqa: F401  registers every model on Base
+
+
+@compiles(JSONB, "sqlite")
+def compile_jsonb_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+@pytest.fixture
+def db():
+    """An in-memory SQLite session with every table created."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def count_queries():
+    """Count the statements a session sends: `with count_queries(db) as queries: ...`."""
+    class QueryCounter:
+        def __init__(self, session):
+            self.engine = session.get_bind()
+            self.statements = []
+
+        def _record(self, conn, cursor, statement, parameters, context, executemany):
+            self.statements.append(statement)
+
+        def __enter__(self):
+            event.listen(self.engine, "before_cursor_execute", self._record)
+            return self.statements
+
+        def __exit__(self, *exc):
+            event.remove(self.engine, "before_cursor_execute", self._record)
+
+    return QueryCounter
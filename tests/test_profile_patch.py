@@ -0,0 +1,145 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import DataError
+
+from api.profile import route
+from database.repositories.profile import (
+    MAX_PATCH_OPERATIONS,
+    InvalidPatchError,
+    _jsonb,
+    json_patch_steps,
+    merge_patch_expression,
+    patch_statement,
+)
+
+UPDATED_AT = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def compile_sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def patch_sql(operations) -> str:
+    return compile_sql(patch_statement(1, "skills", UPDATED_AT, operations=operations))
+
+
+def moves(n):
+    return [{"op": "move", "from": "/0", "path": "/-"}] * n
+
+
+def test_move_sql_grows_linearly():
+    # "move" reads the previous value twice; inlined, the SQL doubled with every operation
+    sizes = [len(patch_sql(moves(n))) for n in (10, 20, 40)]
+    assert sizes[2] - sizes[1] == pytest.approx(2 * (sizes[1] - sizes[0]), rel=0.05)
+    assert sizes[2] < 4 * sizes[0]
+
+
+def test_every_step_is_fenced():
+    # Without OFFSET 0 Postgres pulls the steps back into one expression and runs out of memory
+    sql = patch_sql(moves(5))
+    assert sql.count("LATERAL") == 6
+    assert sql.count("OFFSET") == 6
+
+
+@pytest.mark.parametrize("operation, conditions", [
+    ({"op": "add", "path": "/0", "value": "x"}, 2),  # parent exists, index in range
+    ({"op": "remove", "path": "/0"}, 1),
+    ({"op": "replace", "path": "/0", "value": "x"}, 1),
+    ({"op": "copy", "from": "/0", "path": "/1"}, 3),  # source and parent exist, index in range
+    ({"op": "move", "from": "/0", "path": "/1"}, 3),
+    ({"op": "test", "path": "/0", "value": "x"}, 1),
+])
+def test_operations_require_their_paths(operation, conditions):
+    steps, required, index_checks = json_patch_steps(_jsonb([]), [operation])
+    assert len(required) == conditions
+    assert index_checks == []
+    # "test" only adds a condition
+    assert len(steps) == (1 if operation["op"] == "test" else 2)
+
+
+def test_missing_paths_fail_the_patch():
+    _, required, _ = json_patch_steps(_jsonb({}), [{"op": "remove", "path": "/a/b"}])
+    assert "IS NOT NULL" in compile_sql(required[0])
+
+
+@pytest.mark.parametrize("operation, checks", [
+    ({"op": "add", "path": "/-", "value": "x"}, 0),
+    ({"op": "add", "path": "/-1", "value": "x"}, 1),
+    ({"op": "remove", "path": "/-"}, 1),
+    ({"op": "remove", "path": "/01"}, 1),
+    ({"op": "replace", "path": "/-1/company", "value": "x"}, 2),
+    ({"op": "move", "from": "/-1", "path": "/-"}, 1),
+    ({"op": "test", "path": "/10", "value": "x"}, 0),
+])
+def test_array_indices_are_checked(operation, checks):
+    _, _, index_checks = json_patch_steps(_jsonb([]), [operation])
+    assert len(index_checks) == checks
+
+
+def test_unsupported_operation_is_rejected():
+    with pytest.raises(ValueError):
+        json_patch_steps(_jsonb([]), [{"op": "rename", "path": "/0"}])
+
+
+def test_too_many_operations_are_rejected():
+    with pytest.raises(ValueError):
+        patch_statement(1, "skills", UPDATED_AT, operations=moves(MAX_PATCH_OPERATIONS + 1))
+
+
+def test_merge_patch_removes_null_members():
+    sql = compile_sql(merge_patch_expression(_jsonb({}), {"name": "Alex", "phone": None}))
+    assert "jsonb_build_object" in sql
+    assert " - " in sql
+
+
+class FakeSession:
+    """Stands in for the session the route uses after patch_profile_field."""
+
+    def __init__(self, profile_exists=True):
+        self.profile_exists = profile_exists
+        self.rolled_back = False
+
+    def rollback(self):
+        self.rolled_back = True
+
+    def query(self, *entities):
+        return self
+
+    def filter(self, *criteria):
+        return self
+
+    def first(self):
+        return (1,) if self.profile_exists else None
+
+    def commit(self):
+        pass
+
+
+@pytest.mark.parametrize("outcome, status_code", [
+    (ValueError("Field cannot be patched"), 422),
+    (InvalidPatchError("A path indexes an array with something other than an array index"), 422),
+    (DataError("UPDATE", {}, Exception("path element at position 1 is not an integer")), 422),
+    (None, 409),
+])
+def test_patch_errors_map_to_4xx(monkeypatch, outcome, status_code):
+    def patch_profile_field(*args, **kwargs):
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(route, "patch_profile_field", patch_profile_field)
+    patch = route.profilePatch(updated_at=UPDATED_AT, operations=[{"op": "remove", "path": "/0"}])
+    with pytest.raises(HTTPException) as excinfo:
+        route.patchProfileField(1, "skills", patch, FakeSession())
+    assert excinfo.value.status_code == status_code
+
+
+def test_patch_of_missing_profile_is_404(monkeypatch):
+    monkeypatch.setattr(route, "patch_profile_field", lambda *args, **kwargs: None)
+    patch = route.profilePatch(updated_at=UPDATED_AT, merge={"name": "Alex"})
+    with pytest.raises(HTTPException) as excinfo:
+        route.patchProfileField(1, "personal_info", patch, FakeSession(profile_exists=False))
+    assert excinfo.value.status_code == 404
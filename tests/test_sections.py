@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from database.repositories.section import (
+    GC_GRACE_PERIOD,
+    LAST_STORED_REFRESH,
+    REF_KEY,
+    assemble_resume_data,
+    delete_unreferenced_sections,
+    section_hash,
+    split_resume_data,
+    store_resume_data,
+)
+
+RESUME_DATA = {
+    "header": {"name": "Alex", "email": "alex@example.com"},
+    "summary": "Backend engineer",
+    "skills": ["Python", "Postgres"],
+    "work_experience": [
+        {"title": "Engineer, Acme", "content": ["Built the billing service"]},
+        {"title": "Intern, Globex", "content": ["Wrote tests"]},
+    ],
+    "education": [{"title": "BSc, State University", "content": []}],
+    "additional_sections": [],
+}
+
+
+def test_round_trip():
+    refs, sections = split_resume_data(RESUME_DATA)
+    assert assemble_resume_data(refs, sections) == RESUME_DATA
+
+
+def test_shareable_sections_become_references():
+    refs, sections = split_resume_data(RESUME_DATA)
+    header = refs["header"][REF_KEY]
+    assert sections[header] == RESUME_DATA["header"]
+    assert header == section_hash(RESUME_DATA["header"])
+    assert all(set(item) == {REF_KEY} for item in refs["work_experience"] + refs["education"])
+    # Tailored per job, so kept inline
+    assert refs["summary"] == RESUME_DATA["summary"]
+    assert refs["skills"] == RESUME_DATA["skills"]
+
+
+def test_split_is_idempotent():
+    refs, sections = split_resume_data(RESUME_DATA)
+    again, more = split_resume_data(refs)
+    assert again == refs
+    assert more == {}
+
+
+def test_inline_documents_are_returned_unchanged():
+    # resume_data stored before the section store existed has no references
+    assert assemble_resume_data(RESUME_DATA, {}) == RESUME_DATA
+
+
+def test_missing_section_raises():
+    refs, sections = split_resume_data(RESUME_DATA)
+    del sections[refs["header"][REF_KEY]]
+    with pytest.raises(LookupError):
+        assemble_resume_data(refs, sections)
+
+
+class RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, stmt, *args):
+        self.statements.append(stmt)
+
+
+def test_sections_are_upserted_in_hash_order():
+    db = RecordingSession()
+    store_resume_data(db, RESUME_DATA)
+
+    (stmt,) = db.statements
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    hashes = [value for key, value in compiled.params.items() if key.startswith("hash")]
+    assert hashes == sorted(hashes)
+    # Fresh rows are not rewritten
+    assert "WHERE resume_sections.last_stored_at <" in str(compiled)
+
+
+def test_grace_period_must_exceed_refresh():
+    assert GC_GRACE_PERIOD > LAST_STORED_REFRESH
+    with pytest.raises(ValueError):
+        delete_unreferenced_sections(RecordingSession(), LAST_STORED_REFRESH)
@@ -0,0 +1,198 @@
+import csv
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional
+
+from sqlalchemy import select
+
+from database.database import engine
+from database.models.user import User, pwd_context
+
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+# Rows loaded per COPY / transaction
+CHUNK_SIZE = 5000
+
+STAGING_TABLE = """
+    CREATE TEMP TABLE staging_users (
+        line_no integer NOT NULL,
+        name text NOT NULL,
+        email text NOT NULL,
+        hashed_password text NOT NULL,
+        profile jsonb
+    ) ON COMMIT DROP
+"""
+
+# Deduplicate the chunk by email (first occurrence wins), skip emails that
+# already exist, and create the profiles of the users that were inserted.
+MERGE_STAGING = """
+    WITH src AS (
+        SELECT DISTINCT ON (email) * FROM staging_users ORDER BY email, line_no
+    ),
+    inserted AS (
+        INSERT INTO users (name, email, hashed_password, is_active, is_superuser)
+        SELECT name, email, hashed_password, true, false FROM src
+        ON CONFLICT (email) DO NOTHING
+        RETURNING id, email
+    ),
+    profiles AS (
+        INSERT INTO user_profile (
+            user_id, external_user_id, personal_info, work_experience,
+            education, skills, certifications, projects
+        )
+        SELECT
+            inserted.id,
+            coalesce(src.profile->>'external_user_id', 'import-' || inserted.id),
+            coalesce(src.profile->'personal_info', '{}'::jsonb),
+            coalesce(src.profile->'work_experience', '[]'::jsonb),
+            coalesce(src.profile->'education', '[]'::jsonb),
+            coalesce(src.profile->'skills', '[]'::jsonb),
+            src.profile->'certifications',
+            src.profile->'projects'
+        FROM inserted JOIN src USING (email)
+        WHERE src.profile IS NOT NULL
+        ON CONFLICT (external_user_id) DO NOTHING
+        RETURNING 1
+    )
+    SELECT (SELECT count(*) FROM inserted), (SELECT count(*) FROM profiles)
+"""
+
+
+def _hash_password(password: str) -> str:
+    """Runs in a worker process."""
+    return pwd_context.hash(password)
+
+
+def iter_records(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Read users from a CSV (name, email, password columns) or an NDJSON file.
+
+    NDJSON lines may also carry a "profile" object with the UserProfile
+    documents (personal_info, work_experience, education, skills,
+    certifications, projects) and an optional external_user_id.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.lower().endswith(".csv"):
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def _chunks(records: Iterable[Dict[str, Any]], stats: Dict[str, int], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Validate records and group them into chunks of `chunk_size`."""
+    chunk = []
+    for line_no, record in enumerate(records, start=1):
+        if not (record.get("name") and record.get("email") and record.get("password")):
+            stats["invalid"] += 1
+            continue
+        chunk.append({**record, "line_no": line_no})
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _drop_duplicates(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop records whose email repeats in the chunk or already exists, so they are never hashed."""
+    unique = {}
+    for record in chunk:
+        unique.setdefault(record["email"].strip(), record)
+    with engine.connect() as connection:
+        existing = set(connection.execute(
+            select(User.email).where(User.email.in_(list(unique)))
+        ).scalars())
+    return [record for email, record in unique.items() if email not in existing]
+
+
+def _load_chunk(chunk: List[Dict[str, Any]], hashes: Iterable[str]):
+    """COPY one chunk into a staging table and merge it into users/user_profile in one transaction."""
+    connection = engine.raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(STAGING_TABLE)
+            with cursor.copy(
+                "COPY staging_users (line_no, name, email, hashed_password, profile) FROM STDIN"
+            ) as copy:
+                for record, hashed in zip(chunk, hashes):
+                    profile = record.get("profile")
+                    copy.write_row((
+                        record["line_no"],
+                        record["name"],
+                        record["email"].strip(),
+                        hashed,
+                        json.dumps(profile) if profile is not None else None,
+                    ))
+            cursor.execute(MERGE_STAGING)
+            users, profiles = cursor.fetchone()
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+    return users, profiles
+
+
+def import_users(
+    records: Iterable[Dict[str, Any]],
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    progress: Optional[Callable[[Dict[str, int]], None]] = None,
+) -> Dict[str, int]:
+    """
+    Bulk-create users (and optional profiles) from an iterable of records.
+
+    Passwords are hashed across a process pool while the previous chunk is
+    being copied into Postgres. Each chunk is loaded with COPY into a
+    temporary staging table and merged with INSERT ... ON CONFLICT, so
+    emails that already exist, or repeat within the file, are skipped. Known
+    duplicates are dropped before hashing; the ON CONFLICT catches the rest.
+    `progress` is called with the running counts after every chunk.
+    """
+    stats = {"read": 0, "invalid": 0, "users": 0, "profiles": 0, "duplicates": 0}
+
+    # Workers come from a forkserver, never by forking a threaded server process
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        mp_context=multiprocessing.get_context(start_method),
+    ) as pool:
+        pending = None
+        for chunk in _chunks(records, stats, chunk_size):
+            stats["read"] += len(chunk)
+            new = _drop_duplicates(chunk)
+            stats["duplicates"] += len(chunk) - len(new)
+            # map() submits every hash at once, so the next chunk hashes
+            # while the current one is loaded
+            batch = (new, pool.map(_hash_password, [r["password"] for r in new], chunksize=64))
+            if pending:
+                _merge_stats(stats, pending[0], _load_chunk(*pending), progress)
+            pending = batch
+        if pending:
+            _merge_stats(stats, pending[0], _load_chunk(*pending), progress)
+
+    stats["read"] += stats["invalid"]
+    return stats
+
+
+def _merge_stats(stats: Dict[str, int], chunk: List[Dict[str, Any]], loaded, progress=None):
+    users, profiles = loaded
+    stats["users"] += users
+    stats["profiles"] += profiles
+    stats["duplicates"] += len(chunk) - users
+    logger.info("Imported %d users so far (%d duplicates skipped)", stats["users"], stats["duplicates"])
+    if progress is not None:
+        progress(dict(stats))